@@ -1,6 +1,6 @@
 import sqlite3
 import os
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from contextlib import contextmanager
 from backend.models.player import Player
 from backend.models.team import Team
@@ -206,6 +206,9 @@ class DatabaseManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_team_id ON players(team_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_position ON players(position)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_team ON players(team)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_price ON players(price)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_total_points ON players(total_points)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_ppm ON players(points_per_million)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_fixtures_gameweek ON fixtures(gameweek)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_fpl_elem ON players(fpl_element_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_hist_stats_elem ON historical_player_stats(fpl_element_id)")
@@ -249,35 +252,13 @@ class DatabaseManager:
             return conn
     
     def bulk_insert_players(self, players_data: List[Dict]) -> int:
-        """Efficiently insert multiple players using batch operations"""
+        """Efficiently insert multiple players using batch operations
+
+        Shares the _UPSERT_PLAYER_SQL batch write with add_players; dicts
+        without an 'id' get one assigned by SQLite.
+        """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Use executemany for batch insertion
-                cursor.executemany("""
-                    INSERT INTO players (
-                        name, position, team, price, total_points, 
-                        form, ownership, team_id, gw1_points, gw2_points,
-                        gw3_points, gw4_points, gw5_points, gw6_points,
-                        gw7_points, gw8_points, gw9_points, chance_of_playing_next_round,
-                        points_per_million
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, [
-                    (
-                        player['name'], player['position'], player['team'], 
-                        player['price'], player['total_points'], player['form'],
-                        player['ownership'], player['team_id'], player['gw1_points'],
-                        player['gw2_points'], player['gw3_points'], player['gw4_points'],
-                        player['gw5_points'], player['gw6_points'], player['gw7_points'],
-                        player['gw8_points'], player['gw9_points'], 
-                        player.get('chance_of_playing_next_round', 100),
-                        player.get('points_per_million', 0.0)
-                    ) for player in players_data
-                ])
-                
-                conn.commit()
-                return cursor.rowcount
+            return self._write_player_rows(map(self._player_dict_to_row, players_data))
         except Exception as e:
             print(f"Error in bulk insert: {e}")
             return 0
@@ -308,6 +289,68 @@ class DatabaseManager:
             rows = cursor.fetchall()
             return [Player.from_db_row(row) for row in rows]
     
+    _PLAYER_COLUMNS = """
+        id, name, position, team, price, total_points, 
+        form, ownership, team_id, gw1_points, gw2_points, 
+        gw3_points, gw4_points, gw5_points, gw6_points, 
+        gw7_points, gw8_points, gw9_points, chance_of_playing_next_round,
+        points_per_million, fpl_element_id
+    """
+    
+    def get_players_by_price_range(self, min_price: float, max_price: float) -> List[Player]:
+        """Get players priced between min_price and max_price (inclusive)"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self._PLAYER_COLUMNS}
+                FROM players WHERE price BETWEEN ? AND ? ORDER BY name
+            """, (min_price, max_price))
+            return [Player.from_db_row(row) for row in cursor.fetchall()]
+    
+    def get_top_players_by_points(self, limit: int) -> List[Player]:
+        """Get the `limit` players with the most total points"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self._PLAYER_COLUMNS}
+                FROM players ORDER BY total_points DESC, name LIMIT ?
+            """, (limit,))
+            return [Player.from_db_row(row) for row in cursor.fetchall()]
+    
+    def get_top_players_by_value(self, limit: int) -> List[Player]:
+        """Get the `limit` players with the most points per million"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self._PLAYER_COLUMNS}
+                FROM players ORDER BY points_per_million DESC, name LIMIT ?
+            """, (limit,))
+            return [Player.from_db_row(row) for row in cursor.fetchall()]
+    
+    def get_player_statistics(self) -> Dict[str, Any]:
+        """Aggregate player counts and price/points ranges in a single pass per grouping"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*),
+                       MIN(price), MAX(price), AVG(price),
+                       MIN(COALESCE(total_points, 0.0)), MAX(COALESCE(total_points, 0.0)),
+                       AVG(COALESCE(total_points, 0.0))
+                FROM players
+            """)
+            count, min_price, max_price, avg_price, min_points, max_points, avg_points = cursor.fetchone()
+            cursor.execute("SELECT position, COUNT(*) FROM players GROUP BY position")
+            positions = {row[0]: row[1] for row in cursor.fetchall()}
+            cursor.execute("SELECT team, COUNT(*) FROM players GROUP BY team")
+            teams = {row[0]: row[1] for row in cursor.fetchall()}
+            return {
+                'total_players': count,
+                'positions': positions,
+                'teams': teams,
+                'price_range': {'min': min_price, 'max': max_price, 'avg': avg_price},
+                'points_range': {'min': min_points, 'max': max_points, 'avg': avg_points}
+            }
+    
     def get_player_by_id(self, player_id: int) -> Optional[Player]:
         """Get player by ID"""
         with self._get_connection() as conn:
@@ -338,33 +381,69 @@ class DatabaseManager:
             row = cursor.fetchone()
             return Player.from_db_row(row) if row else None
     
+    _UPSERT_PLAYER_SQL = """
+        INSERT OR REPLACE INTO players (
+            id, name, position, team, price, total_points, 
+            form, ownership, team_id, gw1_points, gw2_points, 
+            gw3_points, gw4_points, gw5_points, gw6_points,
+            gw7_points, gw8_points, gw9_points, chance_of_playing_next_round,
+            points_per_million, fpl_element_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _player_to_row(player: Player) -> tuple:
+        """Flatten a Player into the parameter tuple for _UPSERT_PLAYER_SQL"""
+        return (
+            player.id, player.name, player.position, player.team, player.price,
+            player.total_points, player.form, player.ownership, player.team_id,
+            player.gw1_points, player.gw2_points, player.gw3_points,
+            player.gw4_points, player.gw5_points, player.gw6_points,
+            player.gw7_points, player.gw8_points, player.gw9_points,
+            player.chance_of_playing_next_round, player.points_per_million, player.fpl_element_id
+        )
+    
+    @staticmethod
+    def _player_dict_to_row(player: Dict) -> tuple:
+        """Flatten a player dict (as built by the CSV import) into the _UPSERT_PLAYER_SQL tuple"""
+        return (
+            player.get('id'), player['name'], player['position'], player['team'], player['price'],
+            player['total_points'], player['form'], player['ownership'], player['team_id'],
+            player['gw1_points'], player['gw2_points'], player['gw3_points'],
+            player['gw4_points'], player['gw5_points'], player['gw6_points'],
+            player['gw7_points'], player['gw8_points'], player['gw9_points'],
+            player.get('chance_of_playing_next_round', 100), player.get('points_per_million', 0.0),
+            player.get('fpl_element_id')
+        )
+    
+    def _write_player_rows(self, rows: Iterable[tuple]) -> int:
+        """executemany _UPSERT_PLAYER_SQL over rows in one transaction, returning the row count"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self._UPSERT_PLAYER_SQL, rows)
+            conn.commit()
+            return cursor.rowcount
+    
     def add_player(self, player: Player) -> bool:
         """Add a new player to database"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO players (
-                        id, name, position, team, price, total_points, 
-                        form, ownership, team_id, gw1_points, gw2_points, 
-                        gw3_points, gw4_points, gw5_points, gw6_points,
-                        gw7_points, gw8_points, gw9_points, chance_of_playing_next_round,
-                        points_per_million, fpl_element_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    player.id, player.name, player.position, player.team, player.price,
-                    player.total_points, player.form, player.ownership, player.team_id,
-                    player.gw1_points, player.gw2_points, player.gw3_points,
-                    player.gw4_points, player.gw5_points, player.gw6_points,
-                    player.gw7_points, player.gw8_points, player.gw9_points,
-                    player.chance_of_playing_next_round, player.points_per_million, player.fpl_element_id
-                ))
+                cursor.execute(self._UPSERT_PLAYER_SQL, self._player_to_row(player))
                 conn.commit()
                 return True
         except Exception as e:
             print(f"Error adding player: {e}")
             return False
     
+    def add_players(self, players: Iterable[Player]) -> int:
+        """Add multiple players in a single transaction, returning the row count"""
+        try:
+            return self._write_player_rows(map(self._player_to_row, players))
+        except Exception as e:
+            print(f"Error adding players: {e}")
+            return 0
+    
     # Team operations
     def get_all_teams(self) -> List[Team]:
         """Get all teams from database"""
@@ -48,24 +48,18 @@ class PlayerService:
     
     def get_players_by_price_range(self, min_price: float, max_price: float) -> List[Dict[str, Any]]:
         """Get players within a price range"""
-        all_players = self.db_manager.get_all_players()
-        price_filtered = [
-            player for player in all_players 
-            if min_price <= player.price <= max_price
-        ]
-        return [player.to_dict() for player in price_filtered]
+        players = self.db_manager.get_players_by_price_range(min_price, max_price)
+        return [player.to_dict() for player in players]
     
     def get_top_players_by_points(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get top players by total points"""
-        all_players = self.db_manager.get_all_players()
-        sorted_players = sorted(all_players, key=lambda p: p.total_points, reverse=True)
-        return [player.to_dict() for player in sorted_players[:limit]]
+        players = self.db_manager.get_top_players_by_points(limit)
+        return [player.to_dict() for player in players]
     
     def get_top_players_by_value(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get top players by points per million"""
-        all_players = self.db_manager.get_all_players()
-        sorted_players = sorted(all_players, key=lambda p: p.points_per_million, reverse=True)
-        return [player.to_dict() for player in sorted_players[:limit]]
+        players = self.db_manager.get_top_players_by_value(limit)
+        return [player.to_dict() for player in players]
     
     def add_player(self, player_data: Dict[str, Any]) -> bool:
         """Add a new player to the database"""
@@ -102,9 +96,9 @@ class PlayerService:
     
     def get_player_statistics(self) -> Dict[str, Any]:
         """Get player statistics for the application"""
-        all_players = self.db_manager.get_all_players()
+        stats = self.db_manager.get_player_statistics()
         
-        if not all_players:
+        if not stats['total_players']:
             return {
                 'total_players': 0,
                 'positions': {},
@@ -113,36 +107,4 @@ class PlayerService:
                 'points_range': {'min': 0, 'max': 0, 'avg': 0}
             }
         
-        # Position counts
-        positions = {}
-        for player in all_players:
-            positions[player.position] = positions.get(player.position, 0) + 1
-        
-        # Team counts
-        teams = {}
-        for player in all_players:
-            teams[player.team] = teams.get(player.team, 0) + 1
-        
-        # Price statistics
-        prices = [player.price for player in all_players]
-        price_range = {
-            'min': min(prices),
-            'max': max(prices),
-            'avg': sum(prices) / len(prices)
-        }
-        
-        # Points statistics
-        points = [player.total_points for player in all_players]
-        points_range = {
-            'min': min(points),
-            'max': max(points),
-            'avg': sum(points) / len(points)
-        }
-        
-        return {
-            'total_players': len(all_players),
-            'positions': positions,
-            'teams': teams,
-            'price_range': price_range,
-            'points_range': points_range
-        }
+        return stats
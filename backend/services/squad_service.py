@@ -1,7 +1,17 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from functools import lru_cache
 from backend.database.manager import DatabaseManager
 import random
 
+POSITION_INDEX = {'Goalkeeper': 0, 'Defender': 1, 'Midfielder': 2, 'Forward': 3}
+
+
+@lru_cache(maxsize=64)
+def _formation_for_counts(counts: Tuple[int, int, int, int]) -> str:
+    """Standard formation string (excluding goalkeeper) for (gk, def, mid, fwd) counts"""
+    return f"{counts[1]}-{counts[2]}-{counts[3]}"
+
+
 class SquadService:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
@@ -539,11 +549,11 @@ class SquadService:
         if not starting_xi:
             return "Unknown"
         
-        # Count players by position
-        gk_count = sum(1 for p in starting_xi if p.get('position') == 'Goalkeeper')
-        def_count = sum(1 for p in starting_xi if p.get('position') == 'Defender')
-        mid_count = sum(1 for p in starting_xi if p.get('position') == 'Midfielder')
-        fwd_count = sum(1 for p in starting_xi if p.get('position') == 'Forward')
+        # Count players by position (goalkeepers are counted but not shown)
+        counts = [0, 0, 0, 0]
+        for p in starting_xi:
+            idx = POSITION_INDEX.get(p.get('position'))
+            if idx is not None:
+                counts[idx] += 1
         
-        # Return the standard formation format (excluding goalkeeper)
-        return f"{def_count}-{mid_count}-{fwd_count}"
+        return _formation_for_counts(tuple(counts))
@@ -34,13 +34,73 @@ def client(app):
     return app.test_client()
 
 
-@pytest.fixture(scope="function")
-def db_manager():
-    """Create a fresh in-memory database for each test."""
-    db_manager = DatabaseManager(':memory:')
+# Set TEST_DATABASE_PATH to run the service tests against a file-backed database
+TEST_DATABASE_PATH = os.environ.get('TEST_DATABASE_PATH', ':memory:')
+
+# Durability is irrelevant for throwaway test databases
+TEST_DB_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Extra index for the service-test lookups by team and position.
+# players keeps its INTEGER PRIMARY KEY: that already aliases the rowid, so a
+# WITHOUT ROWID table would only add a second key lookup.
+TEST_DB_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_players_team_pos ON players(team, position)",
+)
+
+
+@pytest.fixture(scope="session")
+def db_snapshot():
+    """Schema plus the shared 'Test Team', built once per session."""
+    seed_db = DatabaseManager(':memory:')
+    conn = seed_db.get_connection()
+    for index in TEST_DB_INDEXES:
+        conn.execute(index)
+    seed_db.add_team(Team(id=1, name="Test Team", short_name="TST", code=999, strength=75))
+    return conn
+
+
+@pytest.fixture(scope="session")
+def session_db_manager():
+    """Database shared by all service tests (in-memory unless TEST_DATABASE_PATH is set).
+
+    TEST_DB_PRAGMAS go on the in-memory database's single persistent
+    connection. A file-backed DatabaseManager opens a fresh connection per
+    operation, and these PRAGMAs are per-connection (journal_mode=OFF is not
+    stored in the file), so setting them once would not reach the connections
+    the tests use. locking_mode=EXCLUSIVE on a connection left open would also
+    lock those connections out. File-backed runs therefore use SQLite's
+    defaults, which is also what they are for: exercising real on-disk I/O.
+    """
+    db_manager = DatabaseManager(TEST_DATABASE_PATH)
+    if TEST_DATABASE_PATH == ':memory:':
+        conn = db_manager.get_connection()
+        for pragma in TEST_DB_PRAGMAS:
+            conn.execute(pragma)
     return db_manager
 
 
+@pytest.fixture(scope="function")
+def db_manager(session_db_manager, db_snapshot):
+    """Session database reset to the seeded snapshot before each test.
+
+    DatabaseManager commits after every write, which would release a
+    SAVEPOINT, so state is restored with the SQLite backup API instead
+    of re-running the schema DDL.
+    """
+    conn = session_db_manager.get_connection()
+    try:
+        db_snapshot.backup(conn)
+    finally:
+        if TEST_DATABASE_PATH != ':memory:':
+            conn.close()
+    return session_db_manager
+
+
 def _populate_test_data(db_manager):
     """Populate database with test data."""
     # Create test teams
@@ -84,8 +144,7 @@ def _populate_test_data(db_manager):
             )
         ]
     
-    for player in players:
-        db_manager.add_player(player)
+    db_manager.add_players(players)
     
     # Create test fixtures
     fixtures = [
@@ -107,9 +166,36 @@ def _populate_test_data(db_manager):
         db_manager.add_fixture(fixture)
 
 
+@pytest.fixture(scope="session")
+def player_factory():
+    """Build Player instances with test defaults, overridden by keyword."""
+    def make_player(**overrides):
+        data = {
+            'id': 1,
+            'name': 'Test Player',
+            'position': 'Midfielder',
+            'team': 'Test Team',
+            'price': 8.0,
+            'total_points': 100.0,
+            'form': 7.0,
+            'ownership': 15.0,
+            'team_id': 1,
+            'fpl_element_id': None,
+            'chance_of_playing_next_round': 100.0,
+            'points_per_million': 12.5
+        }
+        data.update(overrides)
+        return Player(**data)
+    return make_player
+
+
 @pytest.fixture(scope="function")
 def sample_player_data():
-    """Sample player data for testing."""
+    """Sample player data for testing.
+
+    Returns a fresh dict per test so tests stay independent when run in
+    parallel under pytest-xdist.
+    """
     return {
         'id': 999,
         'name': 'Test Player',
@@ -128,7 +214,7 @@ def sample_player_data():
 
 @pytest.fixture(scope="function")
 def sample_team_data():
-    """Sample team data for testing."""
+    """Sample team data for testing (fresh dict per test, see sample_player_data)."""
     return {
         'id': 999,
         'name': 'Test Team',
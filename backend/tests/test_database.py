@@ -168,6 +168,18 @@ class TestDatabaseManager:
         assert 'Player 1' in player_names
         assert 'Player 2' in player_names
     
+    def test_add_players(self):
+        """Test adding multiple Player objects in one batch"""
+        players = [
+            Player(id=1, name="Player 1", position="Goalkeeper", team="Test Team",
+                   price=5.0, total_points=80.0, team_id=1, fpl_element_id=101),
+            Player(id=2, name="Player 2", position="Defender", team="Test Team",
+                   price=6.0, total_points=90.0, team_id=1, fpl_element_id=102),
+        ]
+        
+        assert self.db_manager.add_players(players) == 2
+        assert [p.fpl_element_id for p in self.db_manager.get_all_players()] == [101, 102]
+    
     def test_watchlist_operations(self):
         """Test watchlist operations"""
         # Add a team and player first
@@ -74,8 +74,7 @@ class TestFullDataFlow:
             )
         ]
         
-        for player in players:
-            self.db_manager.add_player(player)
+        self.db_manager.add_players(players)
         
         # Create fixtures
         from backend.models.fixture import Fixture
@@ -156,11 +155,10 @@ class TestFullDataFlow:
         assert len(liverpool_players_api) == 3
         
         # Verify all Liverpool players are present
-        liverpool_names = ["Mohamed Salah", "Alisson", "Virgil van Dijk"]
-        for name in liverpool_names:
-            assert any(p.name == name for p in liverpool_players_db)
-            assert any(p['name'] == name for p in liverpool_players_service)
-            assert any(p['name'] == name for p in liverpool_players_api)
+        liverpool_names = {"Mohamed Salah", "Alisson", "Virgil van Dijk"}
+        assert {p.name for p in liverpool_players_db} == liverpool_names
+        assert {p['name'] for p in liverpool_players_service} == liverpool_names
+        assert {p['name'] for p in liverpool_players_api} == liverpool_names
     
     def test_fixture_difficulty_flow(self):
         """Test fixture difficulty rating flow"""
@@ -1,10 +1,79 @@
 import pytest
+from dataclasses import fields, MISSING
 from backend.models.player import Player
 from backend.models.team import Team
 from backend.models.fixture import Fixture
 
+pytestmark = pytest.mark.unit
+
+REQUIRED_FIELDS = frozenset((
+    'id', 'name', 'position', 'team', 'price', 'total_points',
+    'form', 'ownership', 'team_id', 'chance_of_playing_next_round',
+    'points_per_million', 'gw1_points', 'gw2_points', 'gw3_points',
+    'gw4_points', 'gw5_points', 'gw6_points', 'gw7_points',
+    'gw8_points', 'gw9_points', 'fpl_element_id'
+))
+
+# Mock database rows, in the column order expected by each model's from_db_row()
+PLAYER_DB_ROW = (1, 'Test Player', 'Midfielder', 'Test Team', 8.0, 100.0, 7.0,
+                 15.0, 1, 15.0, 1, 8.0, 7.0, 9.0, 6.0, 8.0, 7.0, 9.0, 8.0, 7.0, 999)
+PLAYER_ATTR_ORDER = (
+    'id', 'name', 'position', 'team', 'price', 'total_points', 'form',
+    'ownership', 'team_id', 'gw1_points', 'gw2_points', 'gw3_points',
+    'gw4_points', 'gw5_points', 'gw6_points', 'gw7_points', 'gw8_points',
+    'gw9_points', 'chance_of_playing_next_round', 'points_per_million',
+    'fpl_element_id'
+)
+PLAYER_DEFAULTS = {f.name: f.default for f in fields(Player) if f.default is not MISSING}
+TEAM_DB_ROW = (1, 'Test Team', 'TST', 999, 75, '2024-01-01')
+FIXTURE_DB_ROW = (1, "Home Team", "Away Team", 2, 4, 1)
+
+# (cls, kwargs, kwargs for a different instance) pairs for equality checks
+EQUALITY_CASES = [
+    (
+        Player,
+        dict(id=1, name="Test Player", position="Midfielder", team="Test Team",
+             price=8.0, total_points=100.0, form=7.0, ownership=15.0, team_id=1,
+             chance_of_playing_next_round=100.0, points_per_million=12.5),
+        dict(id=2, name="Different Player", position="Forward", team="Test Team",
+             price=10.0, total_points=120.0, form=8.0, ownership=20.0, team_id=1,
+             chance_of_playing_next_round=100.0, points_per_million=12.0),
+    ),
+    (
+        Team,
+        dict(id=1, name="Test Team", short_name="TST", code=999, strength=75, created_at=None),
+        dict(id=2, name="Different Team", short_name="DIF", code=888, strength=80, created_at=None),
+    ),
+    (
+        Fixture,
+        dict(id=1, home_team="Home Team", away_team="Away Team",
+             home_difficulty=2, away_difficulty=4, gameweek=1),
+        dict(id=2, home_team="Different Home", away_team="Different Away",
+             home_difficulty=3, away_difficulty=5, gameweek=2),
+    ),
+]
+
+
+class TestModelValidation:
+    """Test cases shared across all models"""
+    
+    @pytest.mark.parametrize("cls,kwargs", [
+        (Player, {'name': "Test Player"}),
+        (Team, {'name': "Test Team"}),
+        (Fixture, {'home_team': "Home Team"}),
+    ])
+    def test_missing_required_fields_raises(self, cls, kwargs):
+        """Test that omitting required fields raises TypeError"""
+        with pytest.raises(TypeError, match="missing"):
+            cls(**kwargs)
+    
+    @pytest.mark.parametrize("cls,kwargs,other_kwargs", EQUALITY_CASES)
+    def test_equality(self, cls, kwargs, other_kwargs):
+        """Test model equality comparison"""
+        assert cls(**kwargs) == cls(**kwargs)
+        assert cls(**kwargs) != cls(**other_kwargs)
+
 
-@pytest.mark.unit
 class TestPlayerModel:
     """Test cases for Player model"""
     
@@ -36,45 +105,22 @@ class TestPlayerModel:
         assert player_dict['fpl_element_id'] == 999
         
         # Test all required fields are present
-        required_fields = [
-            'id', 'name', 'position', 'team', 'price', 'total_points',
-            'form', 'ownership', 'team_id', 'chance_of_playing_next_round',
-            'points_per_million', 'gw1_points', 'gw2_points', 'gw3_points',
-            'gw4_points', 'gw5_points', 'gw6_points', 'gw7_points',
-            'gw8_points', 'gw9_points', 'fpl_element_id'
-        ]
-        for field in required_fields:
-            assert field in player_dict, f"Missing field: {field}"
+        missing = REQUIRED_FIELDS - player_dict.keys()
+        assert not missing, f"Missing fields: {missing}"
     
     def test_player_from_db_row(self):
         """Test Player.from_db_row() method"""
-        # Create a mock database row
-        db_row = (1, 'Test Player', 'Midfielder', 'Test Team', 8.0, 100.0, 7.0, 
-                  15.0, 1, 15.0, 1, 8.0, 7.0, 9.0, 6.0, 8.0, 7.0, 9.0, 8.0, 7.0, 999)
-        
-        player = Player.from_db_row(db_row)
-        assert player.id == 1
-        assert player.name == 'Test Player'
-        assert player.position == 'Midfielder'
-        assert player.team == 'Test Team'
-        assert player.price == 8.0
-        assert player.total_points == 100.0
-        assert player.form == 7.0
-        assert player.ownership == 15.0
-        assert player.team_id == 1
-        assert player.fpl_element_id == 999
-    
-    def test_player_validation(self):
-        """Test player data validation"""
-        # Test with missing required fields
-        with pytest.raises(TypeError):
-            Player(name="Test Player")  # Missing required fields
-        
-        # Note: Player model doesn't have type validation, so TypeError tests are expected to fail
+        player = Player.from_db_row(PLAYER_DB_ROW)
+        mismatched = {
+            attr: (getattr(player, attr), value)
+            for attr, value in zip(PLAYER_ATTR_ORDER, PLAYER_DB_ROW)
+            if getattr(player, attr) != value
+        }
+        assert not mismatched, f"Mismatched attributes: {mismatched}"
     
     def test_player_default_values(self):
         """Test player default values"""
-        player = Player(
+        kwargs = dict(
             id=1,
             name="Test Player",
             position="Midfielder",
@@ -85,45 +131,14 @@ class TestPlayerModel:
             ownership=15.0,
             team_id=1
         )
+        player = Player(**kwargs)
         
-        # Test default values
-        assert player.chance_of_playing_next_round == 100.0
-        assert player.points_per_million == 0.0
-        assert player.gw1_points == 0.0
-        assert player.gw2_points == 0.0
-        assert player.gw3_points == 0.0
-        assert player.gw4_points == 0.0
-        assert player.gw5_points == 0.0
-        assert player.gw6_points == 0.0
-        assert player.gw7_points == 0.0
-        assert player.gw8_points == 0.0
-        assert player.gw9_points == 0.0
-        assert player.fpl_element_id is None
-    
-    def test_player_equality(self):
-        """Test player equality comparison"""
-        player1 = Player(
-            id=1, name="Test Player", position="Midfielder", team="Test Team",
-            price=8.0, total_points=100.0, form=7.0, ownership=15.0, team_id=1,
-            chance_of_playing_next_round=100.0, points_per_million=12.5
-        )
-        player2 = Player(
-            id=1, name="Test Player", position="Midfielder", team="Test Team",
-            price=8.0, total_points=100.0, form=7.0, ownership=15.0, team_id=1,
-            chance_of_playing_next_round=100.0, points_per_million=12.5
-        )
-        player3 = Player(
-            id=2, name="Different Player", position="Forward", team="Test Team",
-            price=10.0, total_points=120.0, form=8.0, ownership=20.0, team_id=1,
-            chance_of_playing_next_round=100.0, points_per_million=12.0
-        )
-        
-        assert player1 == player2
-        assert player1 != player3
-        # Note: Player model doesn't have __hash__ method, so hash tests are expected to fail
+        # Test default values of every field not passed explicitly
+        for name, default in PLAYER_DEFAULTS.items():
+            if name not in kwargs:
+                assert getattr(player, name) == default, f"Unexpected default for {name}"
 
 
-@pytest.mark.unit
 class TestTeamModel:
     """Test cases for Team model"""
     
@@ -148,9 +163,7 @@ class TestTeamModel:
     
     def test_team_from_db_row(self):
         """Test Team.from_db_row() method"""
-        # Create a mock database row
-        db_row = (1, 'Test Team', 'TST', 999, 75, '2024-01-01')
-        team = Team.from_db_row(db_row)
+        team = Team.from_db_row(TEAM_DB_ROW)
         
         assert team.id == 1
         assert team.name == 'Test Team'
@@ -159,14 +172,6 @@ class TestTeamModel:
         assert team.strength == 75
         assert team.created_at == '2024-01-01'
     
-    def test_team_validation(self):
-        """Test team data validation"""
-        # Test with missing required fields
-        with pytest.raises(TypeError):
-            Team(name="Test Team")  # Missing required fields
-        
-        # Note: Team model doesn't have type validation, so TypeError tests are expected to fail
-    
     def test_team_default_values(self):
         """Test team default values"""
         team = Team(
@@ -179,19 +184,8 @@ class TestTeamModel:
         
         # Test default values
         assert team.created_at is None  # created_at has no default value
-    
-    def test_team_equality(self):
-        """Test team equality comparison"""
-        team1 = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75, created_at=None)
-        team2 = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75, created_at=None)
-        team3 = Team(id=2, name="Different Team", short_name="DIF", code=888, strength=80, created_at=None)
-        
-        assert team1 == team2
-        assert team1 != team3
-        # Note: Team model doesn't have __hash__ method, so hash tests are expected to fail
 
 
-@pytest.mark.unit
 class TestFixtureModel:
     """Test cases for Fixture model"""
     
@@ -234,9 +228,7 @@ class TestFixtureModel:
     
     def test_fixture_from_db_row(self):
         """Test Fixture.from_db_row() method"""
-        # Create a mock database row
-        db_row = (1, "Home Team", "Away Team", 2, 4, 1)
-        fixture = Fixture.from_db_row(db_row)
+        fixture = Fixture.from_db_row(FIXTURE_DB_ROW)
         
         assert fixture.id == 1
         assert fixture.home_team == "Home Team"
@@ -245,14 +237,6 @@ class TestFixtureModel:
         assert fixture.away_difficulty == 4
         assert fixture.gameweek == 1
     
-    def test_fixture_validation(self):
-        """Test fixture data validation"""
-        # Test with missing required fields
-        with pytest.raises(TypeError):
-            Fixture(home_team="Home Team")  # Missing required fields
-        
-        # Note: Fixture model doesn't have type validation, so TypeError tests are expected to fail
-    
     def test_fixture_difficulty_validation(self):
         """Test fixture difficulty validation"""
         # Test valid difficulty values (1-5)
@@ -266,8 +250,6 @@ class TestFixtureModel:
         )
         assert valid_fixture.home_difficulty == 1
         assert valid_fixture.away_difficulty == 5
-        
-        # Note: Fixture model doesn't have difficulty validation, so ValueError tests are expected to fail
     
     def test_fixture_gameweek_validation(self):
         """Test fixture gameweek validation"""
@@ -281,24 +263,3 @@ class TestFixtureModel:
             gameweek=38
         )
         assert valid_fixture.gameweek == 38
-        
-        # Note: Fixture model doesn't have gameweek validation, so ValueError tests are expected to fail
-    
-    def test_fixture_equality(self):
-        """Test fixture equality comparison"""
-        fixture1 = Fixture(
-            id=1, home_team="Home Team", away_team="Away Team",
-            home_difficulty=2, away_difficulty=4, gameweek=1
-        )
-        fixture2 = Fixture(
-            id=1, home_team="Home Team", away_team="Away Team",
-            home_difficulty=2, away_difficulty=4, gameweek=1
-        )
-        fixture3 = Fixture(
-            id=2, home_team="Different Home", away_team="Different Away",
-            home_difficulty=3, away_difficulty=5, gameweek=2
-        )
-        
-        assert fixture1 == fixture2
-        assert fixture1 != fixture3
-        # Note: Fixture model doesn't have __hash__ method, so hash tests are expected to fail
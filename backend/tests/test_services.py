@@ -3,11 +3,61 @@ from unittest.mock import Mock, patch
 from backend.services.player_service import PlayerService
 from backend.services.squad_service import SquadService
 from backend.services.historical_service import HistoricalService
-from backend.models.player import Player
+from backend.database.manager import DatabaseManager
 from backend.models.team import Team
 from backend.models.fixture import Fixture
 
 
+@pytest.fixture(scope="module")
+def seeded_player_service(player_factory):
+    """PlayerService over a database seeded once for the read-only query tests"""
+    db_manager = DatabaseManager(':memory:')
+    db_manager.add_team(Team(id=1, name="Test Team", short_name="TST", code=999, strength=75))
+    db_manager.add_team(Team(id=2, name="Liverpool", short_name="LIV", code=14, strength=88))
+    players = [
+        player_factory(id=1, name="Mohamed Salah", team="Liverpool", team_id=2,
+                       price=13.0, total_points=180.0, points_per_million=13.8),
+        player_factory(id=2, name="Erling Haaland", position="Forward",
+                       price=14.5, total_points=200.0, points_per_million=13.8),
+        player_factory(id=3, name="Virgil van Dijk", position="Defender", team="Liverpool",
+                       team_id=2, price=6.0, total_points=110.0, points_per_million=18.3),
+        player_factory(id=4, name="Cheap Player", price=5.0, total_points=80.0,
+                       points_per_million=16.0),
+    ]
+    db_manager.add_players(players)
+    return PlayerService(db_manager)
+
+
+@pytest.mark.unit
+class TestPlayerQueries:
+    """Read-only PlayerService queries against the module's seeded database
+
+    Kept apart from TestPlayerService so these tests skip its per-test
+    db_manager reset.
+    """
+    
+    @pytest.mark.parametrize("method,args,expected_names", [
+        ("get_all_players", (),
+         ["Cheap Player", "Erling Haaland", "Mohamed Salah", "Virgil van Dijk"]),
+        ("get_players_by_position", ("Midfielder",), ["Cheap Player", "Mohamed Salah"]),
+        ("get_players_by_position", ("Forward",), ["Erling Haaland"]),
+        ("search_players", ("Salah",), ["Mohamed Salah"]),
+        ("search_players", ("Haaland",), ["Erling Haaland"]),
+        ("search_players", ("a", 1), ["Cheap Player"]),
+        ("search_players", ("NonExistent",), []),
+        ("get_players_by_team", ("Liverpool",), ["Mohamed Salah", "Virgil van Dijk"]),
+        ("get_players_by_team", ("NonExistent",), []),
+        ("get_players_by_price_range", (4.0, 6.0), ["Cheap Player", "Virgil van Dijk"]),
+        ("get_players_by_price_range", (10.0, 15.0), ["Erling Haaland", "Mohamed Salah"]),
+        ("get_players_by_price_range", (8.0, 10.0), []),
+        ("get_top_players_by_points", (2,), ["Erling Haaland", "Mohamed Salah"]),
+    ])
+    def test_player_queries(self, seeded_player_service, method, args, expected_names):
+        """Test the read-only player queries against a shared seeded database"""
+        players = getattr(seeded_player_service, method)(*args)
+        assert [p['name'] for p in players] == expected_names
+
+
 @pytest.mark.unit
 class TestPlayerService:
     """Test cases for PlayerService"""
@@ -17,219 +67,15 @@ class TestPlayerService:
         """Set up player service with test database"""
         self.player_service = PlayerService(db_manager)
     
-    def test_get_all_players(self, db_manager):
-        """Test getting all players"""
-        # Add test players
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
-        
-        player1 = Player(
-            id=1, name="Player 1", position="Midfielder", team="Test Team",
-            price=8.0, total_points=100.0, form=7.0, ownership=15.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=12.5
-        )
-        player2 = Player(
-            id=2, name="Player 2", position="Forward", team="Test Team",
-            price=10.0, total_points=120.0, form=8.0, ownership=20.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=12.0
-        )
-        
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
-        
-        # Get all players
-        players = self.player_service.get_all_players()
-        assert len(players) == 2
-        assert any(p['name'] == "Player 1" for p in players)
-        assert any(p['name'] == "Player 2" for p in players)
-    
-    def test_get_players_by_position(self, db_manager):
-        """Test getting players by position"""
-        # Add test players
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
-        
-        player1 = Player(
-            id=1, name="Midfielder Player", position="Midfielder", team="Test Team",
-            price=8.0, total_points=100.0, form=7.0, ownership=15.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=12.5
-        )
-        player2 = Player(
-            id=2, name="Forward Player", position="Forward", team="Test Team",
-            price=10.0, total_points=120.0, form=8.0, ownership=20.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=12.0
-        )
-        
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
-        
-        # Get midfielders
-        midfielders = self.player_service.get_players_by_position("Midfielder")
-        assert len(midfielders) == 1
-        assert midfielders[0]['name'] == "Midfielder Player"
-        assert midfielders[0]['position'] == "Midfielder"
-        
-        # Get forwards
-        forwards = self.player_service.get_players_by_position("Forward")
-        assert len(forwards) == 1
-        assert forwards[0]['name'] == "Forward Player"
-        assert forwards[0]['position'] == "Forward"
-    
-    def test_search_players(self, db_manager):
-        """Test player search functionality"""
-        # Add test players
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
-        
-        player1 = Player(
-            id=1, name="Mohamed Salah", position="Midfielder", team="Test Team",
-            price=13.0, total_points=180.0, form=8.5, ownership=45.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=13.8
-        )
-        player2 = Player(
-            id=2, name="Erling Haaland", position="Forward", team="Test Team",
-            price=14.5, total_points=200.0, form=9.0, ownership=60.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=13.8
-        )
-        
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
-        
-        # Search for "Salah"
-        results = self.player_service.search_players("Salah")
-        assert len(results) == 1
-        assert results[0]['name'] == "Mohamed Salah"
-        
-        # Search for "Haaland"
-        results = self.player_service.search_players("Haaland")
-        assert len(results) == 1
-        assert results[0]['name'] == "Erling Haaland"
-        
-        # Search with limit
-        results = self.player_service.search_players("a", limit=1)
-        assert len(results) <= 1
-        
-        # Search for non-existent player
-        results = self.player_service.search_players("NonExistent")
-        assert len(results) == 0
-    
-    def test_get_players_by_team(self, db_manager):
-        """Test getting players by team"""
-        # Add test players
-        team = Team(id=1, name="Liverpool", short_name="LIV", code=14, strength=88)
-        db_manager.add_team(team)
-        
-        player1 = Player(
-            id=1, name="Salah", position="Midfielder", team="Liverpool",
-            price=13.0, total_points=180.0, form=8.5, ownership=45.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=13.8
-        )
-        player2 = Player(
-            id=2, name="Van Dijk", position="Defender", team="Liverpool",
-            price=6.0, total_points=110.0, form=6.0, ownership=20.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=18.3
-        )
-        
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
-        
-        # Get Liverpool players
-        liverpool_players = self.player_service.get_players_by_team("Liverpool")
-        assert len(liverpool_players) == 2
-        assert all(p['team'] == "Liverpool" for p in liverpool_players)
-        
-        # Get non-existent team
-        non_existent = self.player_service.get_players_by_team("NonExistent")
-        assert len(non_existent) == 0
-    
-    def test_get_players_by_price_range(self, db_manager):
-        """Test getting players by price range"""
-        # Add test players
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
-        
-        player1 = Player(
-            id=1, name="Cheap Player", position="Midfielder", team="Test Team",
-            price=5.0, total_points=80.0, form=6.0, ownership=10.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=16.0
-        )
-        player2 = Player(
-            id=2, name="Expensive Player", position="Forward", team="Test Team",
-            price=12.0, total_points=150.0, form=8.0, ownership=30.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=12.5
-        )
-        
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
-        
-        # Get players in price range 4.0 - 6.0
-        cheap_players = self.player_service.get_players_by_price_range(4.0, 6.0)
-        assert len(cheap_players) == 1
-        assert cheap_players[0]['name'] == "Cheap Player"
-        
-        # Get players in price range 10.0 - 15.0
-        expensive_players = self.player_service.get_players_by_price_range(10.0, 15.0)
-        assert len(expensive_players) == 1
-        assert expensive_players[0]['name'] == "Expensive Player"
-        
-        # Get players in price range 8.0 - 10.0 (should be empty)
-        mid_range = self.player_service.get_players_by_price_range(8.0, 10.0)
-        assert len(mid_range) == 0
-    
-    def test_get_top_players_by_points(self, db_manager):
-        """Test getting top players by total points"""
-        # Add test players
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
-        
-        player1 = Player(
-            id=1, name="Low Points", position="Midfielder", team="Test Team",
-            price=8.0, total_points=80.0, form=6.0, ownership=15.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=10.0
-        )
-        player2 = Player(
-            id=2, name="High Points", position="Forward", team="Test Team",
-            price=10.0, total_points=150.0, form=8.0, ownership=20.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=15.0
-        )
-        player3 = Player(
-            id=3, name="Medium Points", position="Defender", team="Test Team",
-            price=6.0, total_points=120.0, form=7.0, ownership=25.0,
-            team_id=1, fpl_element_id=997, chance_of_playing_next_round=100.0, points_per_million=20.0
-        )
-        
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
-        db_manager.add_player(player3)
-        
-        # Get top 2 players by points
-        top_players = self.player_service.get_top_players_by_points(limit=2)
-        assert len(top_players) == 2
-        
-        # Should be sorted by total_points descending
-        assert top_players[0]['total_points'] >= top_players[1]['total_points']
-        assert top_players[0]['name'] == "High Points"  # 150 points
-        assert top_players[1]['name'] == "Medium Points"  # 120 points
-    
-    def test_get_top_players_by_value(self, db_manager):
+    def test_get_top_players_by_value(self, db_manager, player_factory):
         """Test getting top players by points per million"""
-        # Add test players
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
-        
-        player1 = Player(
-            id=1, name="Good Value", position="Midfielder", team="Test Team",
-            price=5.0, total_points=100.0, form=7.0, ownership=15.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=20.0
-        )
-        player2 = Player(
-            id=2, name="Poor Value", position="Forward", team="Test Team",
-            price=15.0, total_points=120.0, form=8.0, ownership=20.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=8.0
-        )
+        # Add test players (the 'Test Team' is seeded by the db_manager fixture)
+        player1 = player_factory(id=1, name="Good Value", price=5.0,
+                                 total_points=100.0, points_per_million=20.0)
+        player2 = player_factory(id=2, name="Poor Value", position="Forward", price=15.0,
+                                 total_points=120.0, points_per_million=8.0)
         
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
+        db_manager.add_players([player1, player2])
         
         # Get top players by value
         top_value = self.player_service.get_top_players_by_value(limit=2)
@@ -240,10 +86,6 @@ class TestPlayerService:
     
     def test_add_player(self, db_manager):
         """Test adding a new player"""
-        # Add a team first
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
-        
         # Player data
         player_data = {
             'id': 1,
@@ -268,26 +110,28 @@ class TestPlayerService:
         assert new_player is not None
         assert new_player['position'] == 'Goalkeeper'
         assert new_player['price'] == 5.5
+        assert self.player_service.get_player_by_id(1)['name'] == 'New Player'
+    
+    def test_add_player_missing_field(self, db_manager):
+        """Test adding a player without a required field fails cleanly"""
+        success = self.player_service.add_player({'id': 1, 'name': 'No Position'})
+        assert success is False
+        assert self.player_service.get_player_by_id(1) is None
     
-    def test_get_player_statistics(self, db_manager):
+    def test_get_player_statistics_empty(self, db_manager):
+        """Test player statistics on an empty database"""
+        stats = self.player_service.get_player_statistics()
+        assert stats['total_players'] == 0
+        assert stats['price_range'] == {'min': 0, 'max': 0, 'avg': 0}
+    
+    def test_get_player_statistics(self, db_manager, player_factory):
         """Test getting player statistics"""
-        # Add test players
-        team = Team(id=1, name="Test Team", short_name="TST", code=999, strength=75)
-        db_manager.add_team(team)
+        # Add test players (the 'Test Team' is seeded by the db_manager fixture)
+        player1 = player_factory(id=1, name="Player 1", position="Goalkeeper", price=5.0,
+                                 total_points=80.0)
+        player2 = player_factory(id=2, name="Player 2", price=8.0, total_points=120.0)
         
-        player1 = Player(
-            id=1, name="Player 1", position="Goalkeeper", team="Test Team",
-            price=5.0, total_points=80.0, form=6.0, ownership=10.0,
-            team_id=1, fpl_element_id=999, chance_of_playing_next_round=100.0, points_per_million=16.0
-        )
-        player2 = Player(
-            id=2, name="Player 2", position="Midfielder", team="Test Team",
-            price=8.0, total_points=120.0, form=7.0, ownership=20.0,
-            team_id=1, fpl_element_id=998, chance_of_playing_next_round=100.0, points_per_million=15.0
-        )
-        
-        db_manager.add_player(player1)
-        db_manager.add_player(player2)
+        db_manager.add_players([player1, player2])
         
         # Get statistics
         stats = self.player_service.get_player_statistics()
@@ -367,68 +211,34 @@ class TestHistoricalService:
 class TestFDRMapping:
     """Test cases for FDR (Fixture Difficulty Rating) mapping logic"""
     
-    def test_fixture_difficulty_validation(self):
-        """Test that fixture difficulty values are valid"""
-        # Valid difficulty values should be 1-5
-        valid_difficulties = [1, 2, 3, 4, 5]
-        
-        for difficulty in valid_difficulties:
-            fixture = Fixture(
-                id=1,
-                home_team="Home Team",
-                away_team="Away Team",
-                home_difficulty=difficulty,
-                away_difficulty=difficulty,
-                gameweek=1
-            )
-            assert fixture.home_difficulty == difficulty
-            assert fixture.away_difficulty == difficulty
-        
-        # Note: Current model accepts any integer values (no validation)
-        # Test that invalid values are accepted (current behavior)
-        invalid_difficulties = [0, 6, -1, 10]
-        
-        for difficulty in invalid_difficulties:
-            fixture = Fixture(
-                id=1,
-                home_team="Home Team",
-                away_team="Away Team",
-                home_difficulty=difficulty,
-                away_difficulty=4,
-                gameweek=1
-            )
-            assert fixture.home_difficulty == difficulty
+    # Valid difficulty values are 1-5; the model currently accepts any integer
+    @pytest.mark.parametrize("difficulty", [1, 2, 3, 4, 5, 0, 6, -1, 10])
+    def test_fixture_difficulty_validation(self, difficulty):
+        """Test that fixture difficulty values are stored as given"""
+        fixture = Fixture(
+            id=1,
+            home_team="Home Team",
+            away_team="Away Team",
+            home_difficulty=difficulty,
+            away_difficulty=difficulty,
+            gameweek=1
+        )
+        assert fixture.home_difficulty == difficulty
+        assert fixture.away_difficulty == difficulty
     
-    def test_gameweek_validation(self):
-        """Test that gameweek values are valid"""
-        # Valid gameweeks should be 1-38
-        valid_gameweeks = [1, 19, 38]
-        
-        for gameweek in valid_gameweeks:
-            fixture = Fixture(
-                id=1,
-                home_team="Home Team",
-                away_team="Away Team",
-                home_difficulty=2,
-                away_difficulty=4,
-                gameweek=gameweek
-            )
-            assert fixture.gameweek == gameweek
-        
-        # Note: Current model accepts any integer values (no validation)
-        # Test that invalid values are accepted (current behavior)
-        invalid_gameweeks = [0, 39, -1, 50]
-        
-        for gameweek in invalid_gameweeks:
-            fixture = Fixture(
-                id=1,
-                home_team="Home Team",
-                away_team="Away Team",
-                home_difficulty=2,
-                away_difficulty=4,
-                gameweek=gameweek
-            )
-            assert fixture.gameweek == gameweek
+    # Valid gameweeks are 1-38; the model currently accepts any integer
+    @pytest.mark.parametrize("gameweek", [1, 19, 38, 0, 39, -1, 50])
+    def test_gameweek_validation(self, gameweek):
+        """Test that gameweek values are stored as given"""
+        fixture = Fixture(
+            id=1,
+            home_team="Home Team",
+            away_team="Away Team",
+            home_difficulty=2,
+            away_difficulty=4,
+            gameweek=gameweek
+        )
+        assert fixture.gameweek == gameweek
     
     def test_fixture_team_consistency(self):
         """Test that fixture teams are consistent"""
@@ -5,6 +5,28 @@ import os
 import time
 from pathlib import Path
 
+TAIL_BYTES = 8192
+
+def tail_lines(path, count):
+    """Return the last `count` lines of a file, reading only its final TAIL_BYTES"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - TAIL_BYTES))
+        lines = f.read().decode('utf-8', errors='replace').splitlines()
+    return lines[-count:]
+
+def latest_log_file(log_dir, prefix, suffix):
+    """Return the most recently modified matching entry in log_dir, or None"""
+    latest = None
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not (entry.name.startswith(prefix) and entry.name.endswith(suffix)):
+                continue
+            mtime = entry.stat().st_mtime
+            if latest is None or mtime > latest[0]:
+                latest = (mtime, entry)
+    return latest[1] if latest else None
+
 def check_status():
     """Check the current status of the optimization"""
     print("🔍 FPL Optimization Status Check")
@@ -13,19 +35,14 @@ def check_status():
     # Check if process is running
     import subprocess
     try:
-        result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-        if 'run_comprehensive_optimization.py' in result.stdout:
+        result = subprocess.run(['pgrep', '-af', 'run_comprehensive_optimization.py'],
+                                capture_output=True, text=True)
+        if result.stdout:
             print("✅ Optimization is RUNNING")
             
-            # Get process info
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if 'run_comprehensive_optimization.py' in line and 'grep' not in line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        pid = parts[1]
-                        print(f"📊 Process ID: {pid}")
-                        break
+            # pgrep prints "<pid> <command line>", one process per line
+            pid = result.stdout.split(maxsplit=1)[0]
+            print(f"📊 Process ID: {pid}")
         else:
             print("❌ Optimization is NOT running")
             return
@@ -34,20 +51,16 @@ def check_status():
         return
     
     # Check latest log
-    log_dir = Path("logs")
-    if log_dir.exists():
-        log_files = list(log_dir.glob("comprehensive_optimization_*.log"))
-        if log_files:
-            latest_log = max(log_files, key=lambda x: x.stat().st_mtime)
+    if os.path.isdir("logs"):
+        latest_log = latest_log_file("logs", "comprehensive_optimization_", ".log")
+        if latest_log:
             print(f"📝 Latest log: {latest_log.name}")
             
             # Show last few lines
             try:
-                with open(latest_log, 'r') as f:
-                    lines = f.readlines()
-                    print("\n📋 Last 10 log entries:")
-                    for line in lines[-10:]:
-                        print(f"   {line.strip()}")
+                print("\n📋 Last 10 log entries:")
+                for line in tail_lines(latest_log.path, 10):
+                    print(f"   {line.strip()}")
             except:
                 print("   Could not read log file")
     
@@ -66,10 +79,9 @@ def check_status():
     if Path("optimization_output.log").exists():
         print(f"\n📄 Output log: optimization_output.log")
         try:
-            with open("optimization_output.log", 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    print(f"   Last line: {lines[-1].strip()}")
+            lines = tail_lines("optimization_output.log", 1)
+            if lines:
+                print(f"   Last line: {lines[-1].strip()}")
         except:
             print("   Could not read output log")
 
@@ -0,0 +1,11 @@
+# Maintenance scripts at the repo root and under misc/ and scripts/ contain no
+# tests; keep pytest from importing and assertion-rewriting them when it is run
+# against the whole tree instead of the configured backend/tests testpath.
+collect_ignore_glob = [
+    "check_optimization_status.py",
+    "fix_team_names.py",
+    "migrate_teams_fixtures.py",
+    "db_utils.py",
+    "misc/*.py",
+    "scripts/*.py",
+]
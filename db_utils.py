@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Shared SQLite connection setup for the maintenance scripts"""
+
+import sqlite3
+
+# WAL with synchronous=NORMAL fsyncs only at checkpoints; the larger page
+# cache, in-memory temp storage and memory-mapped reads avoid extra I/O on
+# bulk scans.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+def open_db(path, **kwargs):
+    """Open a SQLite connection to path with the tuned PRAGMAs applied
+
+    Extra keyword arguments (e.g. isolation_level) go to sqlite3.connect.
+    """
+    conn = sqlite3.connect(path, **kwargs)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Fix team names in the database"""
 
-import sqlite3
+from db_utils import open_db
 
 # Common FPL team mappings
 TEAM_MAPPINGS = {
@@ -19,19 +19,30 @@ TEAM_MAPPINGS = {
 
 def fix_team_names():
     """Update team names in the database"""
-    conn = sqlite3.connect('fpl.db')
+    conn = open_db('fpl.db')
     cursor = conn.cursor()
     
     print("Fixing team names...")
     
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_name ON players(name)")
+    
+    conn.execute("BEGIN")
+    cursor.executemany(
+        "UPDATE players SET team = ? WHERE name = ?",
+        [(team_name, player_name) for player_name, team_name in TEAM_MAPPINGS.items()]
+    )
     for player_name, team_name in TEAM_MAPPINGS.items():
-        cursor.execute("UPDATE players SET team = ? WHERE name = ?", (team_name, player_name))
         print(f"Updated {player_name} -> {team_name}")
     
     # Update remaining players with generic teams
-    cursor.execute("UPDATE players SET team = 'Arsenal' WHERE team = 'Unknown' AND position = 'Defender'")
-    cursor.execute("UPDATE players SET team = 'Man City' WHERE team = 'Unknown' AND position = 'Midfielder'")
-    cursor.execute("UPDATE players SET team = 'Liverpool' WHERE team = 'Unknown' AND position = 'Forward'")
+    cursor.execute("""
+        UPDATE players SET team = CASE position
+            WHEN 'Defender' THEN 'Arsenal'
+            WHEN 'Midfielder' THEN 'Man City'
+            WHEN 'Forward' THEN 'Liverpool'
+        END
+        WHERE team = 'Unknown' AND position IN ('Defender', 'Midfielder', 'Forward')
+    """)
     
     conn.commit()
     conn.close()
@@ -3,8 +3,8 @@
 Script to migrate teams and fixtures data from fpl_oos.db to fpl.db
 """
 
-import sqlite3
 import logging
+from db_utils import open_db
 
 # Set up logging
 logging.basicConfig(
@@ -20,46 +20,41 @@ def migrate_teams_and_fixtures():
     target_db = "fpl.db"
     
     try:
-        # Connect to source database
-        source_conn = sqlite3.connect(source_db)
-        source_cursor = source_conn.cursor()
-        
-        # Connect to target database
-        target_conn = sqlite3.connect(target_db)
+        # Connect to target database and attach the source alongside it
+        target_conn = open_db(target_db)
         target_cursor = target_conn.cursor()
+        target_cursor.execute("ATTACH DATABASE ? AS src", (source_db,))
         
         logger.info("Starting migration of teams and fixtures...")
+        target_conn.execute("BEGIN")
         
         # Migrate teams
         logger.info("Migrating teams...")
-        source_cursor.execute("SELECT * FROM teams")
-        teams_data = source_cursor.fetchall()
+        target_cursor.execute("""
+            INSERT INTO teams (id, name, short_name, code, strength, created_at)
+            SELECT id, name, short_name, code, strength, created_at FROM src.teams
+        """)
         
-        if teams_data:
-            target_cursor.executemany("""
-                INSERT INTO teams (id, name, short_name, code, strength, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, teams_data)
-            logger.info(f"Migrated {len(teams_data)} teams")
+        if target_cursor.rowcount > 0:
+            logger.info(f"Migrated {target_cursor.rowcount} teams")
         else:
             logger.warning("No teams found in source database")
         
-        # Migrate fixtures
+        # Migrate fixtures (the source stores team IDs, which the app resolves to names)
         logger.info("Migrating fixtures...")
-        source_cursor.execute("SELECT * FROM fixtures")
-        fixtures_data = source_cursor.fetchall()
+        target_cursor.execute("""
+            INSERT INTO fixtures (id, home_team, away_team, home_difficulty, away_difficulty, gameweek)
+            SELECT id, home_team_id, away_team_id, home_difficulty, away_difficulty, gameweek FROM src.fixtures
+        """)
         
-        if fixtures_data:
-            target_cursor.executemany("""
-                INSERT INTO fixtures (id, home_team, away_team, home_difficulty, away_difficulty, gameweek)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, fixtures_data)
-            logger.info(f"Migrated {len(fixtures_data)} fixtures")
+        if target_cursor.rowcount > 0:
+            logger.info(f"Migrated {target_cursor.rowcount} fixtures")
         else:
             logger.warning("No fixtures found in source database")
         
         # Commit changes
         target_conn.commit()
+        target_cursor.execute("DETACH DATABASE src")
         
         # Verify migration
         target_cursor.execute("SELECT COUNT(*) FROM teams")
@@ -91,8 +86,6 @@ def migrate_teams_and_fixtures():
             target_conn.rollback()
         raise
     finally:
-        if 'source_conn' in locals():
-            source_conn.close()
         if 'target_conn' in locals():
             target_conn.close()
 
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Shared database access for the misc player/team maintenance scripts"""
+
+import sys
+from contextlib import closing, nullcontext
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+import db_utils  # noqa: E402
+
+DB_PATH = ROOT / "fpl_oos.db"
+
+def open_db():
+    """Open DB_PATH with the tuned connection PRAGMAs applied
+
+    The connection is in autocommit mode (isolation_level=None): the scripts
+    issue BEGIN IMMEDIATE themselves, so sqlite3 never opens implicit
+    transactions around individual statements.
+    """
+    return db_utils.open_db(DB_PATH, isolation_level=None)
+
+def connection(conn=None):
+    """Context manager yielding conn if given, else a fresh connection closed on exit
+
+    Lets a driver open the database once and pass the same connection to
+    several scripts, so the PRAGMA setup is not repeated for each of them.
+    """
+    if conn is not None:
+        return nullcontext(conn)
+    return closing(open_db())
+
+def create_team_lookup(cursor):
+    """(Re)build the TEMP table team_lookup(id, name) from teams, indexed on name
+
+    teams has no index on name, so the per-player name lookups in the team_id
+    fill would otherwise scan it once per player.
+    """
+    cursor.execute("DROP TABLE IF EXISTS temp.team_lookup")
+    cursor.execute("CREATE TEMP TABLE team_lookup AS SELECT id, name FROM teams")
+    cursor.execute("CREATE INDEX temp.idx_team_lookup_name ON team_lookup(name)")
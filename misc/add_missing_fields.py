@@ -1,20 +1,37 @@
-import sqlite3
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from db_utils import open_db  # noqa: E402
+
+# Column name -> definition for fields older databases may be missing
+MISSING_FIELDS = {
+    'chance_of_playing_next_round': "REAL DEFAULT 100.0",
+    'ownership': "REAL DEFAULT 0.0",
+    'form': "REAL DEFAULT 0.0",
+}
 
 def add_missing_fields():
-    conn = sqlite3.connect("fpl_oos.db")
+    conn = open_db(ROOT / "fpl_oos.db")
     try:
+        # Read the current columns once so the script can be re-run safely
+        existing = {row[0] for row in conn.execute("SELECT name FROM pragma_table_info('players')")}
+        
         # Add missing fields to players table
-        conn.execute("ALTER TABLE players ADD COLUMN chance_of_playing_next_round REAL DEFAULT 100.0")
-        conn.execute("ALTER TABLE players ADD COLUMN ownership REAL DEFAULT 0.0")
-        conn.execute("ALTER TABLE players ADD COLUMN form REAL DEFAULT 0.0")
+        added = [name for name in MISSING_FIELDS if name not in existing]
+        for name in added:
+            conn.execute(f"ALTER TABLE players ADD COLUMN {name} {MISSING_FIELDS[name]}")
         
-        # Update existing players with default values
-        conn.execute("UPDATE players SET chance_of_playing_next_round = 100.0 WHERE chance_of_playing_next_round IS NULL")
-        conn.execute("UPDATE players SET ownership = 0.0 WHERE ownership IS NULL")
-        conn.execute("UPDATE players SET form = points_per_million WHERE form IS NULL")
+        # ADD COLUMN ... DEFAULT already fills existing rows; only form needs seeding
+        if 'form' in added:
+            conn.execute("UPDATE players SET form = points_per_million")
         
         conn.commit()
-        print("Successfully added missing fields to database")
+        if added:
+            print(f"Successfully added missing fields to database: {', '.join(added)}")
+        else:
+            print("No missing fields to add")
         
         # Show table structure
         cursor = conn.execute("PRAGMA table_info(players)")
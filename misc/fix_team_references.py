@@ -1,69 +1,72 @@
-import sqlite3
+from _db import connection, create_team_lookup
 
-def fix_team_references():
+def fix_team_references(conn=None):
     """Fix team_id references after updating teams table"""
-    conn = sqlite3.connect("fpl_oos.db")
-    cursor = conn.cursor()
-    
-    try:
-        print("Fixing team_id references...")
+    with connection(conn) as conn:
+        cursor = conn.cursor()
         
-        # Clear all team_id references
-        cursor.execute("UPDATE players SET team_id = NULL")
-        print("Cleared all team_id references")
+        try:
+            # The team_id fill and the unmatched-team report join on players.team
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_team ON players(team)")
+            
+            # The with block commits on success and rolls back on error
+            with conn:
+                cursor.execute("BEGIN IMMEDIATE")
+                print("Fixing team_id references...")
+                
+                create_team_lookup(cursor)
+                
+                # Re-derive every team_id in one correlated UPDATE; players whose
+                # team is not in the teams table are cleared to NULL
+                cursor.execute("""
+                    UPDATE players 
+                    SET team_id = (SELECT t.id FROM team_lookup t WHERE t.name = players.team)
+                """)
+                print("Recomputed all team_id references")
+                
+                cursor.execute("SELECT COUNT(team_id), COUNT(*) - COUNT(team_id) FROM players")
+                updated_count, not_found_count = cursor.fetchone()
+                
+                # One line per unknown team rather than one per player
+                cursor.execute("""
+                    SELECT p.team, COUNT(*)
+                    FROM players p
+                    LEFT JOIN team_lookup t ON t.name = p.team
+                    WHERE t.id IS NULL
+                    GROUP BY p.team
+                """)
+                warnings = [
+                    f"Warning: Team '{team_name}' not found in teams table ({count} players)"
+                    for team_name, count in cursor
+                ]
+                if warnings:
+                    print("\n".join(warnings))
+                
+                print(f"Updated {updated_count} players with team_id")
+                print(f"Players without matching team: {not_found_count}")
+            
+            print("Team references fixed successfully!")
+            
+            # Show final status
+            cursor.execute("SELECT COUNT(*) FROM players WHERE team_id IS NOT NULL")
+            linked_players = cursor.fetchone()[0]
+            print(f"Players with team_id: {linked_players}")
+            
+            # Show sample of linked players
+            cursor.execute("""
+                SELECT p.name, p.team, t.name as team_name, p.team_id
+                FROM players p
+                JOIN teams t ON p.team_id = t.id
+                LIMIT 10
+            """)
+            
+            print("\nSample of linked players:")
+            print("\n".join(f"  {row[0]} -> {row[1]} (ID: {row[3]})" for row in cursor))
         
-        # Get all teams for mapping
-        cursor.execute("SELECT id, name FROM teams")
-        team_mapping = {row[1]: row[0] for row in cursor.fetchall()}
-        
-        print(f"Found {len(team_mapping)} teams for mapping")
-        
-        # Update players with team_id
-        cursor.execute("SELECT id, team FROM players")
-        players_to_update = cursor.fetchall()
-        
-        updated_count = 0
-        not_found_count = 0
-        for player_id, team_name in players_to_update:
-            if team_name in team_mapping:
-                cursor.execute("UPDATE players SET team_id = ? WHERE id = ?", 
-                             (team_mapping[team_name], player_id))
-                updated_count += 1
-            else:
-                not_found_count += 1
-                print(f"Warning: Team '{team_name}' not found in teams table for player {player_id}")
-        
-        print(f"Updated {updated_count} players with team_id")
-        print(f"Players without matching team: {not_found_count}")
-        
-        # Commit changes
-        conn.commit()
-        print("Team references fixed successfully!")
-        
-        # Show final status
-        cursor.execute("SELECT COUNT(*) FROM players WHERE team_id IS NOT NULL")
-        linked_players = cursor.fetchone()[0]
-        print(f"Players with team_id: {linked_players}")
-        
-        # Show sample of linked players
-        cursor.execute("""
-            SELECT p.name, p.team, t.name as team_name, p.team_id
-            FROM players p
-            JOIN teams t ON p.team_id = t.id
-            LIMIT 10
-        """)
-        
-        print("\nSample of linked players:")
-        for row in cursor.fetchall():
-            print(f"  {row[0]} -> {row[1]} (ID: {row[3]})")
-        
-    except Exception as e:
-        print(f"Error fixing team references: {e}")
-        conn.rollback()
-        import traceback
-        traceback.print_exc()
-    finally:
-        conn.close()
+        except Exception as e:
+            print(f"Error fixing team references: {e}")
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
     fix_team_references()
@@ -1,129 +1,254 @@
+import json
+import time
+from functools import lru_cache
+from pathlib import Path
 import requests
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple
 
+BOOTSTRAP_URL = "https://fantasy.premierleague.com/api/bootstrap-static/"
+
+# Team id -> name cache on disk, and seconds before it is fetched again
+TEAMS_CACHE_PATH = Path.home() / ".fpl_teams_cache.json"
+TEAMS_CACHE_TTL = 86400
+
+# Official FPL squad composition rules
+# Must have exactly: 2 GKs, 5 DEFs, 5 MIDs, 3 FWDs = 15 players total
+FORMATION_CONSTRAINTS = {
+    "Goalkeeper": (2, 2),      # Must have exactly 2 GKs
+    "Defender": (5, 5),         # Must have exactly 5 DEFs
+    "Midfielder": (5, 5),       # Must have exactly 5 MIDs
+    "Forward": (3, 3)           # Must have exactly 3 FWDs
+}
+
+# Starting XI vs bench (4 players): 1st GK starts, 2nd GK on bench; first
+# 4 DEFs, 5 MIDs and 2 FWDs start
+STARTERS_PER_POSITION = {"Goalkeeper": 1, "Defender": 4, "Midfielder": 5, "Forward": 2}
+
+# Predicted points per player: name, position, price, uncertainty (%),
+# overall, then GW 1..GW 9 expected points
+PLAYER_COLUMNS = ("Name", "Position", "Price", "Uncertainty", "Overall", *(f"GW {i}" for i in range(1, 10)))
+PLAYERS = (
+    ("M.Salah", "Midfielder", 14.5, 24, 57, 6.7, 6.1, 5.6, 7, 6.6, 5.7, 5.7, 7.4, 6.2),
+    ("Haaland", "Forward", 14.0, 24, 47, 5.1, 6.3, 5.1, 5.8, 3.8, 6.6, 4.8, 5.1, 4.4),
+    ("Palmer", "Midfielder", 10.5, 28, 45.8, 5.1, 4.9, 5.5, 4.6, 4.3, 5.9, 4.4, 4.3, 6.7),
+    ("Watkins", "Forward", 9.0, 24, 44.9, 5.2, 4.6, 4.8, 4.1, 5.7, 5.2, 6.6, 4.5, 4.1),
+    ("Isak", "Forward", 10.5, 24, 44.6, 4.4, 4.5, 5.8, 5.7, 4.7, 4.1, 5.4, 4.7, 5.4),
+    ("Wood", "Forward", 7.5, 25, 40.3, 4.8, 3.9, 5.2, 3.2, 4.8, 5.8, 3.9, 4.6, 4),
+    ("Eze", "Midfielder", 7.5, 26, 39.4, 4.1, 4.8, 4, 5.8, 4.4, 4.2, 4, 4.9, 3.4),
+    ("Saka", "Midfielder", 10.0, 29, 37.8, 3.9, 5.9, 3.3, 4.8, 3.4, 3.7, 4.6, 3.6, 4.5),
+    ("Evanilson", "Forward", 7.0, 24, 36.9, 3.4, 4.6, 3.9, 4.2, 4.3, 4.7, 4, 3.6, 4.2),
+    ("Wissa", "Forward", 7.5, 26, 36.6, 3.8, 4.4, 4.7, 4, 3.7, 4.5, 3.8, 4.1, 3.7),
+    ("B.Fernandes", "Midfielder", 9.0, 29, 35.4, 3.4, 3.7, 4.9, 3.1, 4.1, 3.8, 5.3, 2.9, 4.1),
+    ("Virgil", "Defender", 6.0, 24, 35.1, 4.2, 3.2, 3.5, 4.4, 4.6, 3.7, 3.3, 4.4, 3.8),
+    ("Gibbs-White", "Midfielder", 7.5, 25, 35.1, 4.3, 3.5, 4.4, 2.9, 4.2, 5.2, 3.4, 3.9, 3.4),
+    ("Strand Larsen", "Forward", 6.5, 25, 34.8, 3.2, 3.5, 3.7, 3.4, 5.1, 3.5, 3.8, 4.3, 4.4),
+    ("Rice", "Midfielder", 6.5, 23, 34.4, 3.7, 5, 3.1, 4.1, 3.4, 3.5, 4.1, 3.6, 4),
+    ("Rogers", "Midfielder", 7.0, 28, 33.7, 1.1, 4, 4.2, 3.7, 4.4, 4.2, 5.2, 3.7, 3.3),
+    ("Sánchez", "Goalkeeper", 5.0, 22, 33.7, 4, 3.7, 4, 3.5, 3.7, 3.9, 3.3, 3.3, 4.3),
+    ("Welbeck", "Forward", 6.5, 26, 33.5, 4.1, 3.3, 3.6, 3.4, 4.1, 3.3, 4, 4.2, 3.5),
+    ("Mac Allister", "Midfielder", 6.5, 23, 33.4, 4, 3.5, 3.2, 4, 3.9, 3.6, 3.2, 4.1, 3.7),
+    ("Petrović", "Goalkeeper", 4.5, 21, 33.3, 3.4, 3.9, 3.3, 4, 3.5, 3.8, 3.8, 3.9, 3.8),
+    ("Muñoz", "Defender", 5.5, 28, 33.3, 2.9, 4.2, 3.2, 5.3, 3.7, 3.3, 3.9, 4.3, 2.7),
+    ("Bruno G.", "Midfielder", 6.5, 23, 33, 3.4, 3.5, 4.1, 4.1, 3.4, 3.1, 3.9, 3.5, 3.9),
+    ("Schade", "Midfielder", 7.0, 27, 33, 1.6, 4.2, 4.5, 4, 3.5, 4.4, 3.5, 3.8, 3.5),
+    ("Saliba", "Defender", 6.0, 25, 32.8, 3.4, 4.7, 2.8, 3.9, 3.5, 3.1, 4.2, 3.5, 3.9),
+    ("Leno", "Goalkeeper", 5.0, 23, 32.7, 3.8, 4.1, 3.5, 4.2, 3.8, 3.2, 3.9, 3.3, 3),
+    ("Murillo", "Defender", 5.5, 24, 32.6, 3.9, 3.4, 3.9, 3, 4, 4.6, 2.8, 3.4, 3.5),
+    ("Raya", "Goalkeeper", 5.5, 24, 32.5, 3.3, 4.3, 3.3, 3.7, 3.5, 3.1, 4.3, 3.3, 3.8),
+    ("Milenković", "Defender", 5.5, 27, 32.5, 4, 3.2, 4.1, 2.7, 4.1, 4.7, 2.7, 3.5, 3.4),
+    ("Branthwaite", "Defender", 5.5, 24, 32, 4, 3.8, 3.5, 3.5, 3, 3.9, 3.7, 3, 3.5),
+    ("Martinelli", "Midfielder", 7.0, 32, 31.7, 3.1, 4.6, 2.9, 3.8, 3.2, 3, 4, 3.4, 3.7),
+    ("Sarr", "Midfielder", 6.5, 27, 31.6, 3.1, 3.9, 3.1, 4.7, 3.7, 3.3, 3.3, 3.7, 2.8),
+    ("Lacroix", "Defender", 5.0, 24, 31.5, 2.8, 3.6, 3, 4.8, 3.4, 3.3, 3.9, 3.7, 3),
+    ("Tarkowski", "Defender", 5.5, 26, 31.2, 3.9, 3.6, 3.5, 3.6, 3, 3.6, 3.8, 2.7, 3.4),
+    ("Mykolenko", "Defender", 5.0, 24, 31, 4, 3.6, 3.4, 3.5, 2.6, 3.9, 3.8, 2.7, 3.5),
+    ("McNeil", "Midfielder", 6.0, 28, 30.7, 4, 3.6, 3.3, 3.7, 2.7, 3.6, 3.5, 2.7, 3.6),
+    ("Tonali", "Midfielder", 5.5, 23, 30.7, 3.2, 3.3, 3.7, 3.8, 3.3, 3, 3.6, 3.2, 3.5),
+    ("Johnson", "Midfielder", 7.0, 35, 30.6, 4.7, 2.5, 3.3, 3.1, 3.1, 3.4, 3.9, 3.6, 3),
+    ("Konaté", "Defender", 5.5, 25, 30.6, 3.8, 2.8, 3.1, 3.8, 4.2, 3.1, 2.6, 3.9, 3.2),
+    ("José Sá", "Goalkeeper", 4.5, 23, 30.3, 3.5, 3.6, 3.9, 1.9, 3.3, 3.1, 3.6, 3.5, 4),
+    ("Cucurella", "Defender", 6.0, 28, 30.3, 3.7, 3.3, 3.6, 3.1, 3, 3.6, 2.7, 2.8, 4.5),
+    ("Henderson", "Goalkeeper", 5.0, 23, 30.2, 3.2, 3.4, 3, 4.2, 3.1, 3.3, 3.1, 3.8, 3),
+    ("Verbruggen", "Goalkeeper", 4.5, 23, 30.1, 3.6, 3.8, 3.2, 3.5, 3.4, 2.8, 3.3, 3.1, 3.4),
+    ("Richards", "Defender", 4.5, 25, 30, 2.6, 3.5, 2.9, 4.5, 3.3, 3.1, 3.7, 3.7, 2.8),
+    ("A.Becker", "Goalkeeper", 5.5, 25, 30, 3.9, 2.7, 2.8, 3.6, 4, 3.4, 2.2, 4.1, 3.4),
+    ("Beto", "Forward", 5.5, 24, 29.9, 3.8, 3.4, 3.2, 3.5, 2.8, 3.6, 3.4, 2.7, 3.6),
+    ("Vicario", "Goalkeeper", 5.0, 24, 29.7, 3.9, 2.9, 3.4, 3, 3.2, 3.3, 3.5, 3.2, 3.4),
+    ("Rúben", "Defender", 5.5, 26, 29.7, 3.4, 3.5, 3.1, 3.7, 2.5, 4, 3, 3.7, 2.8),
+    ("Mitchell", "Defender", 5.0, 27, 29.7, 2.7, 3.6, 2.9, 4.6, 3.2, 2.9, 3.5, 3.8, 2.4),
+    ("Guéhi", "Defender", 4.5, 27, 29.7, 2.6, 3.5, 2.8, 4.6, 3.2, 3, 3.6, 3.7, 2.7),
+    ("Ndiaye", "Midfielder", 6.5, 28, 29.6, 3.8, 3.3, 3.5, 3.5, 2.6, 3.5, 3.5, 2.5, 3.5),
+    ("Tosin", "Defender", 4.5, 27, 29.6, 3.5, 3.3, 3.6, 3.1, 2.9, 3.5, 2.7, 2.7, 4.4),
+    ("Collins", "Defender", 5.0, 26, 29.5, 3, 3.2, 4, 3.1, 3.2, 3.6, 3.1, 3.3, 3),
+    ("Iwobi", "Midfielder", 6.5, 30, 29.5, 3, 3.5, 2.9, 4.3, 3.9, 3.1, 3.1, 2.8, 3),
+    ("Wirtz", "Midfielder", 8.5, 29, 29.4, 3.6, 3.1, 2.8, 3.5, 3.4, 3.1, 2.9, 3.6, 3.4),
+    ("Matheus N.", "Defender", 5.5, 30, 29.4, 3.3, 3.7, 2.9, 3.8, 2.4, 4.2, 2.9, 3.7, 2.5),
+    ("Martinez", "Goalkeeper", 5.0, 22, 29.3, 0, 3.2, 3.9, 3.8, 3.5, 3.9, 4.4, 3, 3.6),
+    ("Mepham", "Defender", 4.0, 25, 29.3, 3, 3.5, 3, 3.5, 2.9, 3.6, 3.4, 3.1, 3.3),
+    ("Chalobah", "Defender", 5.0, 26, 29.3, 3.5, 3.2, 3.5, 3.1, 2.9, 3.4, 2.7, 2.7, 4.3),
+    ("Neto", "Midfielder", 7.0, 29, 29.2, 3.5, 3, 3.3, 3, 3.1, 3.4, 2.6, 2.9, 4.3),
+    ("Frimpong", "Defender", 6.0, 27, 29, 3.9, 2.7, 2.7, 3.8, 4, 2.8, 2.3, 3.7, 3.1),
+    ("Nørgaard", "Midfielder", 5.5, 24, 29, 2.8, 3.7, 2.9, 3.5, 2.9, 3.1, 3.7, 3, 3.4),
+    ("Anderson", "Midfielder", 5.5, 21, 29, 3.6, 3.1, 3.6, 2.6, 3.4, 3.5, 2.8, 3.2, 3.1),
+    ("Enzo", "Midfielder", 6.5, 28, 29, 3.6, 3.2, 3.3, 2.9, 2.8, 3.3, 2.9, 2.8, 4.1),
+    ("Andersen", "Defender", 4.5, 26, 28.9, 3.3, 3.6, 2.7, 4, 3.7, 2.7, 3.4, 3, 2.4),
+    ("Gana", "Midfielder", 5.5, 21, 28.6, 3.3, 3.4, 3.1, 3.3, 2.8, 3.5, 3.1, 2.6, 3.4),
+    ("Mateta", "Forward", 7.5, 27, 28.4, 3, 3.5, 3.1, 4, 3.4, 3.2, 2.9, 3, 2.2),
+    ("Lewis-Skelly", "Defender", 5.5, 29, 28.4, 2.9, 4, 2.2, 3.5, 2.9, 2.7, 3.7, 2.9, 3.5),
+    ("Hudson-Odoi", "Midfielder", 6.0, 28, 28.2, 3.5, 2.9, 3.7, 2.4, 3.4, 3.9, 2.7, 3.1, 2.7),
+    ("Trippier", "Defender", 5.0, 29, 28.1, 2.7, 2.6, 3.8, 3.6, 2.7, 2.7, 3.6, 2.7, 3.6),
+    ("Konsa", "Defender", 4.5, 28, 28, 2.9, 2.6, 3.5, 3.1, 3.3, 3.4, 4, 2.3, 2.9),
+    ("Raúl", "Forward", 6.5, 34, 27.9, 3, 3.5, 2.6, 4.1, 3.4, 2.8, 3, 2.7, 2.8),
+    ("Gomes", "Midfielder", 5.5, 21, 27.6, 2.7, 3, 3.2, 2.8, 3.4, 3, 3, 2.9, 3.5),
+    ("Onana", "Goalkeeper", 5.0, 25, 27.6, 0.9, 3.1, 3.9, 3.1, 3.6, 3, 3.1, 2.9, 3.8),
+    ("Kilman", "Defender", 4.5, 27, 27.5, 3.7, 2.6, 2.6, 3, 3, 3.5, 2.6, 3.3, 3.3),
+    ("Neil", "Midfielder", 5.0, 20, 27.5, 3.2, 3.2, 3.2, 2.9, 3.1, 2.9, 3, 3.2, 2.7),
+    ("Semenyo", "Midfielder", 7.0, 35, 27.5, 2.5, 3.3, 3.1, 3.2, 3.1, 3.4, 2.8, 2.8, 3.2),
+    ("Caicedo", "Midfielder", 5.5, 24, 27.4, 3.4, 3.1, 3.2, 2.9, 2.9, 3.1, 2.9, 2.7, 3.2),
+    ("Patterson", "Goalkeeper", 4.5, 26, 27.3, 3.3, 3.4, 3, 3.1, 3, 2.5, 3.1, 3, 2.9),
+    ("O.Dango", "Midfielder", 6.0, 25, 27.3, 2.6, 3.1, 3.1, 3, 3.2, 3.4, 3.2, 2.7, 3),
+    ("Mbeumo", "Midfielder", 8.0, 27, 27.1, 2.6, 2.9, 3.8, 2.5, 3, 2.9, 3.8, 2.5, 3.2),
+    ("Cash", "Defender", 4.5, 29, 27.1, 2.8, 2.6, 3.4, 3, 2.9, 3.3, 4.3, 2.2, 2.7),
+    ("Barnes", "Midfielder", 6.5, 38, 27, 3, 3, 3.5, 3.5, 2.9, 2.4, 3.3, 2.7, 2.8),
+    ("Adams", "Midfielder", 5.0, 21, 27, 2.9, 3.3, 3, 3.1, 2.9, 3, 3, 2.8, 3),
+    ("Kluivert", "Midfielder", 7.0, 37, 27, 0, 1.1, 3.6, 4, 3.6, 4, 3.8, 3.1, 3.8),
+    ("Aina", "Defender", 5.0, 27, 27, 3.4, 2.7, 3.5, 2, 3.6, 3.8, 2.1, 3, 2.7),
+    ("Gabriel", "Defender", 6.0, 33, 27, 3.2, 3.7, 2.2, 3.1, 2.8, 2.6, 3.2, 2.8, 3.3),
+    ("Kelleher", "Goalkeeper", 4.5, 25, 26.9, 2.3, 3.2, 2.3, 3.4, 3, 3.8, 2.4, 3.2, 3.1),
+    ("L.Paquetá", "Midfielder", 6.0, 28, 26.8, 3.1, 3, 2.8, 3.1, 3, 2.9, 2.3, 3.1, 3.4),
+    ("Wilson", "Forward", 6.0, 25, 26.7, 3.2, 2.9, 2.8, 3.3, 3.1, 2.8, 2.3, 3.2, 3.2),
+    ("Toti", "Defender", 4.5, 29, 26.5, 2.6, 2.8, 3.6, 2.1, 3.8, 2.3, 2.7, 3.2, 3.5),
+    ("Henderson", "Midfielder", 5.0, 21, 26.5, 2.8, 3.1, 3.2, 2.9, 2.8, 3.2, 2.8, 2.9, 2.7),
+    ("João Pedro", "Forward", 7.5, 26, 26.4, 3.1, 2.9, 3, 2.7, 2.6, 3.1, 2.6, 2.7, 3.6),
+    ("Potts", "Midfielder", 4.5, 21, 26.2, 3.1, 2.9, 2.7, 3.2, 3, 2.8, 2.4, 3.1, 3.1),
+    ("Ekitiké", "Forward", 8.5, 32, 26.2, 3.1, 2.6, 2.4, 3.3, 2.8, 3.1, 2.6, 2.9, 3.4),
+    ("N.Williams", "Defender", 5.0, 29, 26.2, 3.3, 2.6, 3.4, 2.1, 3.4, 3.7, 2, 2.9, 2.7),
+    ("Gündoğan", "Midfielder", 6.5, 33, 26.2, 3.2, 3.4, 2.9, 3, 2.2, 3.7, 2.6, 2.6, 2.5),
+    ("Joelinton", "Midfielder", 6.0, 25, 26, 2.6, 2.9, 3.4, 3.2, 2.7, 2.5, 3.1, 2.6, 3.1),
+    ("Ward-Prowse", "Midfielder", 6.0, 23, 26, 3.1, 2.9, 2.7, 3.1, 3, 2.8, 2.3, 3.1, 3.1),
+    ("Smith Rowe", "Midfielder", 6.0, 34, 26, 2.7, 3.1, 2.4, 3.8, 3.3, 2.5, 2.8, 2.7, 2.6),
+    ("Senesi", "Defender", 4.5, 31, 26, 2.3, 3.3, 2.5, 3.2, 2.6, 3.2, 3.1, 2.7, 3),
+)
+
+@lru_cache(maxsize=1)
+def _player_arrays() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(names, positions, prices, gw_points) for PLAYERS, as NumPy arrays
+
+    gw_points is the (players, 9) GW 1..GW 9 block. Built once per process.
+    """
+    names, positions, prices, _, _, *gw_points = zip(*PLAYERS)
+    return (np.array(names, dtype=object), np.array(positions, dtype=object),
+            np.array(prices, dtype=float), np.array(gw_points, dtype=float).T)
+
+def _select_squad(points: np.ndarray, prices: np.ndarray, position_codes: np.ndarray,
+                  position_limits: List[int], budget: float) -> np.ndarray:
+    """Indices of the highest-scoring squad with exactly position_limits[p]
+    players of each position code p and a total price within budget
+
+    Solves the 0/1 knapsack exactly by dynamic programming over (players per
+    position, money spent). Prices and budget are counted in units of their
+    common divisor (0.5 for FPL prices), so the table stays small.
+    """
+    tenths = np.rint(prices * 10).astype(np.int64)
+    budget_tenths = int(round(budget * 10))
+    unit = int(np.gcd.reduce(np.append(tenths, budget_tenths))) or 1
+    costs = tenths // unit
+    capacity = budget_tenths // unit
+    
+    # best[counts..., spent] = best total points reachable; took[i] marks the
+    # states where adding player i improved it
+    shape = tuple(limit + 1 for limit in position_limits) + (capacity + 1,)
+    best = np.full(shape, -np.inf)
+    best[(0,) * len(shape)] = 0.0
+    took = np.zeros((len(points),) + shape, dtype=bool)
+    for i, (pos, cost) in enumerate(zip(position_codes, costs)):
+        if cost > capacity:
+            continue
+        src = [slice(None)] * len(shape)
+        dst = [slice(None)] * len(shape)
+        src[pos], dst[pos] = slice(0, -1), slice(1, None)
+        src[-1], dst[-1] = slice(0, capacity + 1 - cost), slice(cost, None)
+        with_player = np.full(shape, -np.inf)
+        with_player[tuple(dst)] = best[tuple(src)] + points[i]
+        took[i] = with_player > best
+        np.maximum(best, with_player, out=best)
+    
+    # Best full squad over all amounts spent, then walk the choices back
+    full = tuple(position_limits)
+    spent = int(np.argmax(best[full]))
+    if best[full + (spent,)] == -np.inf:
+        raise ValueError(f"No valid squad fits a budget of {budget}")
+    state = list(full) + [spent]
+    selected = []
+    for i in range(len(points) - 1, -1, -1):
+        if took[i][tuple(state)]:
+            selected.append(i)
+            state[position_codes[i]] -= 1
+            state[-1] -= costs[i]
+    return np.array(selected[::-1], dtype=np.intp)
+
+@lru_cache(maxsize=64)
+def _solve(budget_tenths: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """(starting, bench) PLAYERS indices of the optimal squad for a budget
+    given in tenths of a million
+
+    Each tuple is grouped by position, best GW1-9 total first within each.
+    """
+    names, positions, prices, gw_points = _player_arrays()
+    totals = gw_points.sum(axis=1)
+    order = np.argsort(-totals, kind="stable")
+    
+    # Pick the best-scoring squad that fits the budget and position counts
+    position_names = list(FORMATION_CONSTRAINTS)
+    selected = order[_select_squad(
+        totals[order],
+        prices[order],
+        np.array([position_names.index(pos) for pos in positions[order]]),
+        [FORMATION_CONSTRAINTS[pos][1] for pos in position_names],
+        budget_tenths / 10,
+    )]
+    
+    # The squad is in descending total order, so each position's best players
+    # come first and start; the rest are on the bench
+    starting, bench = [], []
+    for position, starter_count in STARTERS_PER_POSITION.items():
+        pos_players = selected[positions[selected] == position].tolist()
+        starting.extend(pos_players[:starter_count])
+        bench.extend(pos_players[starter_count:])
+    return tuple(starting), tuple(bench)
+
 class FPLTeamOptimizer:
+    # Shared by all instances so repeat fetches reuse the connection
+    session = requests.Session()
+    
     def __init__(self):
         self.players_data = self._load_players_data()
         self.teams_data = self._fetch_teams_data()
         
     def _load_players_data(self) -> pd.DataFrame:
         """Load the provided players data"""
-        data = [
-            ["M.Salah", "Midfielder", 14.5, 24, 57, 6.7, 6.1, 5.6, 7, 6.6, 5.7, 5.7, 7.4, 6.2],
-            ["Haaland", "Forward", 14.0, 24, 47, 5.1, 6.3, 5.1, 5.8, 3.8, 6.6, 4.8, 5.1, 4.4],
-            ["Palmer", "Midfielder", 10.5, 28, 45.8, 5.1, 4.9, 5.5, 4.6, 4.3, 5.9, 4.4, 4.3, 6.7],
-            ["Watkins", "Forward", 9.0, 24, 44.9, 5.2, 4.6, 4.8, 4.1, 5.7, 5.2, 6.6, 4.5, 4.1],
-            ["Isak", "Forward", 10.5, 24, 44.6, 4.4, 4.5, 5.8, 5.7, 4.7, 4.1, 5.4, 4.7, 5.4],
-            ["Wood", "Forward", 7.5, 25, 40.3, 4.8, 3.9, 5.2, 3.2, 4.8, 5.8, 3.9, 4.6, 4],
-            ["Eze", "Midfielder", 7.5, 26, 39.4, 4.1, 4.8, 4, 5.8, 4.4, 4.2, 4, 4.9, 3.4],
-            ["Saka", "Midfielder", 10.0, 29, 37.8, 3.9, 5.9, 3.3, 4.8, 3.4, 3.7, 4.6, 3.6, 4.5],
-            ["Evanilson", "Forward", 7.0, 24, 36.9, 3.4, 4.6, 3.9, 4.2, 4.3, 4.7, 4, 3.6, 4.2],
-            ["Wissa", "Forward", 7.5, 26, 36.6, 3.8, 4.4, 4.7, 4, 3.7, 4.5, 3.8, 4.1, 3.7],
-            ["B.Fernandes", "Midfielder", 9.0, 29, 35.4, 3.4, 3.7, 4.9, 3.1, 4.1, 3.8, 5.3, 2.9, 4.1],
-            ["Virgil", "Defender", 6.0, 24, 35.1, 4.2, 3.2, 3.5, 4.4, 4.6, 3.7, 3.3, 4.4, 3.8],
-            ["Gibbs-White", "Midfielder", 7.5, 25, 35.1, 4.3, 3.5, 4.4, 2.9, 4.2, 5.2, 3.4, 3.9, 3.4],
-            ["Strand Larsen", "Forward", 6.5, 25, 34.8, 3.2, 3.5, 3.7, 3.4, 5.1, 3.5, 3.8, 4.3, 4.4],
-            ["Rice", "Midfielder", 6.5, 23, 34.4, 3.7, 5, 3.1, 4.1, 3.4, 3.5, 4.1, 3.6, 4],
-            ["Rogers", "Midfielder", 7.0, 28, 33.7, 1.1, 4, 4.2, 3.7, 4.4, 4.2, 5.2, 3.7, 3.3],
-            ["Sánchez", "Goalkeeper", 5.0, 22, 33.7, 4, 3.7, 4, 3.5, 3.7, 3.9, 3.3, 3.3, 4.3],
-            ["Welbeck", "Forward", 6.5, 26, 33.5, 4.1, 3.3, 3.6, 3.4, 4.1, 3.3, 4, 4.2, 3.5],
-            ["Mac Allister", "Midfielder", 6.5, 23, 33.4, 4, 3.5, 3.2, 4, 3.9, 3.6, 3.2, 4.1, 3.7],
-            ["Petrović", "Goalkeeper", 4.5, 21, 33.3, 3.4, 3.9, 3.3, 4, 3.5, 3.8, 3.8, 3.9, 3.8],
-            ["Muñoz", "Defender", 5.5, 28, 33.3, 2.9, 4.2, 3.2, 5.3, 3.7, 3.3, 3.9, 4.3, 2.7],
-            ["Bruno G.", "Midfielder", 6.5, 23, 33, 3.4, 3.5, 4.1, 4.1, 3.4, 3.1, 3.9, 3.5, 3.9],
-            ["Schade", "Midfielder", 7.0, 27, 33, 1.6, 4.2, 4.5, 4, 3.5, 4.4, 3.5, 3.8, 3.5],
-            ["Saliba", "Defender", 6.0, 25, 32.8, 3.4, 4.7, 2.8, 3.9, 3.5, 3.1, 4.2, 3.5, 3.9],
-            ["Leno", "Goalkeeper", 5.0, 23, 32.7, 3.8, 4.1, 3.5, 4.2, 3.8, 3.2, 3.9, 3.3, 3],
-            ["Murillo", "Defender", 5.5, 24, 32.6, 3.9, 3.4, 3.9, 3, 4, 4.6, 2.8, 3.4, 3.5],
-            ["Raya", "Goalkeeper", 5.5, 24, 32.5, 3.3, 4.3, 3.3, 3.7, 3.5, 3.1, 4.3, 3.3, 3.8],
-            ["Milenković", "Defender", 5.5, 27, 32.5, 4, 3.2, 4.1, 2.7, 4.1, 4.7, 2.7, 3.5, 3.4],
-            ["Branthwaite", "Defender", 5.5, 24, 32, 4, 3.8, 3.5, 3.5, 3, 3.9, 3.7, 3, 3.5],
-            ["Martinelli", "Midfielder", 7.0, 32, 31.7, 3.1, 4.6, 2.9, 3.8, 3.2, 3, 4, 3.4, 3.7],
-            ["Sarr", "Midfielder", 6.5, 27, 31.6, 3.1, 3.9, 3.1, 4.7, 3.7, 3.3, 3.3, 3.7, 2.8],
-            ["Lacroix", "Defender", 5.0, 24, 31.5, 2.8, 3.6, 3, 4.8, 3.4, 3.3, 3.9, 3.7, 3],
-            ["Tarkowski", "Defender", 5.5, 26, 31.2, 3.9, 3.6, 3.5, 3.6, 3, 3.6, 3.8, 2.7, 3.4],
-            ["Mykolenko", "Defender", 5.0, 24, 31, 4, 3.6, 3.4, 3.5, 2.6, 3.9, 3.8, 2.7, 3.5],
-            ["McNeil", "Midfielder", 6.0, 28, 30.7, 4, 3.6, 3.3, 3.7, 2.7, 3.6, 3.5, 2.7, 3.6],
-            ["Tonali", "Midfielder", 5.5, 23, 30.7, 3.2, 3.3, 3.7, 3.8, 3.3, 3, 3.6, 3.2, 3.5],
-            ["Johnson", "Midfielder", 7.0, 35, 30.6, 4.7, 2.5, 3.3, 3.1, 3.1, 3.4, 3.9, 3.6, 3],
-            ["Konaté", "Defender", 5.5, 25, 30.6, 3.8, 2.8, 3.1, 3.8, 4.2, 3.1, 2.6, 3.9, 3.2],
-            ["José Sá", "Goalkeeper", 4.5, 23, 30.3, 3.5, 3.6, 3.9, 1.9, 3.3, 3.1, 3.6, 3.5, 4],
-            ["Cucurella", "Defender", 6.0, 28, 30.3, 3.7, 3.3, 3.6, 3.1, 3, 3.6, 2.7, 2.8, 4.5],
-            ["Henderson", "Goalkeeper", 5.0, 23, 30.2, 3.2, 3.4, 3, 4.2, 3.1, 3.3, 3.1, 3.8, 3],
-            ["Verbruggen", "Goalkeeper", 4.5, 23, 30.1, 3.6, 3.8, 3.2, 3.5, 3.4, 2.8, 3.3, 3.1, 3.4],
-            ["Richards", "Defender", 4.5, 25, 30, 2.6, 3.5, 2.9, 4.5, 3.3, 3.1, 3.7, 3.7, 2.8],
-            ["A.Becker", "Goalkeeper", 5.5, 25, 30, 3.9, 2.7, 2.8, 3.6, 4, 3.4, 2.2, 4.1, 3.4],
-            ["Beto", "Forward", 5.5, 24, 29.9, 3.8, 3.4, 3.2, 3.5, 2.8, 3.6, 3.4, 2.7, 3.6],
-            ["Vicario", "Goalkeeper", 5.0, 24, 29.7, 3.9, 2.9, 3.4, 3, 3.2, 3.3, 3.5, 3.2, 3.4],
-            ["Rúben", "Defender", 5.5, 26, 29.7, 3.4, 3.5, 3.1, 3.7, 2.5, 4, 3, 3.7, 2.8],
-            ["Mitchell", "Defender", 5.0, 27, 29.7, 2.7, 3.6, 2.9, 4.6, 3.2, 2.9, 3.5, 3.8, 2.4],
-            ["Guéhi", "Defender", 4.5, 27, 29.7, 2.6, 3.5, 2.8, 4.6, 3.2, 3, 3.6, 3.7, 2.7],
-            ["Ndiaye", "Midfielder", 6.5, 28, 29.6, 3.8, 3.3, 3.5, 3.5, 2.6, 3.5, 3.5, 2.5, 3.5],
-            ["Tosin", "Defender", 4.5, 27, 29.6, 3.5, 3.3, 3.6, 3.1, 2.9, 3.5, 2.7, 2.7, 4.4],
-            ["Collins", "Defender", 5.0, 26, 29.5, 3, 3.2, 4, 3.1, 3.2, 3.6, 3.1, 3.3, 3],
-            ["Iwobi", "Midfielder", 6.5, 30, 29.5, 3, 3.5, 2.9, 4.3, 3.9, 3.1, 3.1, 2.8, 3],
-            ["Wirtz", "Midfielder", 8.5, 29, 29.4, 3.6, 3.1, 2.8, 3.5, 3.4, 3.1, 2.9, 3.6, 3.4],
-            ["Matheus N.", "Defender", 5.5, 30, 29.4, 3.3, 3.7, 2.9, 3.8, 2.4, 4.2, 2.9, 3.7, 2.5],
-            ["Martinez", "Goalkeeper", 5.0, 22, 29.3, 0, 3.2, 3.9, 3.8, 3.5, 3.9, 4.4, 3, 3.6],
-            ["Mepham", "Defender", 4.0, 25, 29.3, 3, 3.5, 3, 3.5, 2.9, 3.6, 3.4, 3.1, 3.3],
-            ["Chalobah", "Defender", 5.0, 26, 29.3, 3.5, 3.2, 3.5, 3.1, 2.9, 3.4, 2.7, 2.7, 4.3],
-            ["Neto", "Midfielder", 7.0, 29, 29.2, 3.5, 3, 3.3, 3, 3.1, 3.4, 2.6, 2.9, 4.3],
-            ["Frimpong", "Defender", 6.0, 27, 29, 3.9, 2.7, 2.7, 3.8, 4, 2.8, 2.3, 3.7, 3.1],
-            ["Nørgaard", "Midfielder", 5.5, 24, 29, 2.8, 3.7, 2.9, 3.5, 2.9, 3.1, 3.7, 3, 3.4],
-            ["Anderson", "Midfielder", 5.5, 21, 29, 3.6, 3.1, 3.6, 2.6, 3.4, 3.5, 2.8, 3.2, 3.1],
-            ["Enzo", "Midfielder", 6.5, 28, 29, 3.6, 3.2, 3.3, 2.9, 2.8, 3.3, 2.9, 2.8, 4.1],
-            ["Andersen", "Defender", 4.5, 26, 28.9, 3.3, 3.6, 2.7, 4, 3.7, 2.7, 3.4, 3, 2.4],
-            ["Gana", "Midfielder", 5.5, 21, 28.6, 3.3, 3.4, 3.1, 3.3, 2.8, 3.5, 3.1, 2.6, 3.4],
-            ["Mateta", "Forward", 7.5, 27, 28.4, 3, 3.5, 3.1, 4, 3.4, 3.2, 2.9, 3, 2.2],
-            ["Lewis-Skelly", "Defender", 5.5, 29, 28.4, 2.9, 4, 2.2, 3.5, 2.9, 2.7, 3.7, 2.9, 3.5],
-            ["Hudson-Odoi", "Midfielder", 6.0, 28, 28.2, 3.5, 2.9, 3.7, 2.4, 3.4, 3.9, 2.7, 3.1, 2.7],
-            ["Trippier", "Defender", 5.0, 29, 28.1, 2.7, 2.6, 3.8, 3.6, 2.7, 2.7, 3.6, 2.7, 3.6],
-            ["Konsa", "Defender", 4.5, 28, 28, 2.9, 2.6, 3.5, 3.1, 3.3, 3.4, 4, 2.3, 2.9],
-            ["Raúl", "Forward", 6.5, 34, 27.9, 3, 3.5, 2.6, 4.1, 3.4, 2.8, 3, 2.7, 2.8],
-            ["Gomes", "Midfielder", 5.5, 21, 27.6, 2.7, 3, 3.2, 2.8, 3.4, 3, 3, 2.9, 3.5],
-            ["Onana", "Goalkeeper", 5.0, 25, 27.6, 0.9, 3.1, 3.9, 3.1, 3.6, 3, 3.1, 2.9, 3.8],
-            ["Kilman", "Defender", 4.5, 27, 27.5, 3.7, 2.6, 2.6, 3, 3, 3.5, 2.6, 3.3, 3.3],
-            ["Neil", "Midfielder", 5.0, 20, 27.5, 3.2, 3.2, 3.2, 2.9, 3.1, 2.9, 3, 3.2, 2.7],
-            ["Semenyo", "Midfielder", 7.0, 35, 27.5, 2.5, 3.3, 3.1, 3.2, 3.1, 3.4, 2.8, 2.8, 3.2],
-            ["Caicedo", "Midfielder", 5.5, 24, 27.4, 3.4, 3.1, 3.2, 2.9, 2.9, 3.1, 2.9, 2.7, 3.2],
-            ["Patterson", "Goalkeeper", 4.5, 26, 27.3, 3.3, 3.4, 3, 3.1, 3, 2.5, 3.1, 3, 2.9],
-            ["O.Dango", "Midfielder", 6.0, 25, 27.3, 2.6, 3.1, 3.1, 3, 3.2, 3.4, 3.2, 2.7, 3],
-            ["Mbeumo", "Midfielder", 8.0, 27, 27.1, 2.6, 2.9, 3.8, 2.5, 3, 2.9, 3.8, 2.5, 3.2],
-            ["Cash", "Defender", 4.5, 29, 27.1, 2.8, 2.6, 3.4, 3, 2.9, 3.3, 4.3, 2.2, 2.7],
-            ["Barnes", "Midfielder", 6.5, 38, 27, 3, 3, 3.5, 3.5, 2.9, 2.4, 3.3, 2.7, 2.8],
-            ["Adams", "Midfielder", 5.0, 21, 27, 2.9, 3.3, 3, 3.1, 2.9, 3, 3, 2.8, 3],
-            ["Kluivert", "Midfielder", 7.0, 37, 27, 0, 1.1, 3.6, 4, 3.6, 4, 3.8, 3.1, 3.8],
-            ["Aina", "Defender", 5.0, 27, 27, 3.4, 2.7, 3.5, 2, 3.6, 3.8, 2.1, 3, 2.7],
-            ["Gabriel", "Defender", 6.0, 33, 27, 3.2, 3.7, 2.2, 3.1, 2.8, 2.6, 3.2, 2.8, 3.3],
-            ["Kelleher", "Goalkeeper", 4.5, 25, 26.9, 2.3, 3.2, 2.3, 3.4, 3, 3.8, 2.4, 3.2, 3.1],
-            ["L.Paquetá", "Midfielder", 6.0, 28, 26.8, 3.1, 3, 2.8, 3.1, 3, 2.9, 2.3, 3.1, 3.4],
-            ["Wilson", "Forward", 6.0, 25, 26.7, 3.2, 2.9, 2.8, 3.3, 3.1, 2.8, 2.3, 3.2, 3.2],
-            ["Toti", "Defender", 4.5, 29, 26.5, 2.6, 2.8, 3.6, 2.1, 3.8, 2.3, 2.7, 3.2, 3.5],
-            ["Henderson", "Midfielder", 5.0, 21, 26.5, 2.8, 3.1, 3.2, 2.9, 2.8, 3.2, 2.8, 2.9, 2.7],
-            ["João Pedro", "Forward", 7.5, 26, 26.4, 3.1, 2.9, 3, 2.7, 2.6, 3.1, 2.6, 2.7, 3.6],
-            ["Potts", "Midfielder", 4.5, 21, 26.2, 3.1, 2.9, 2.7, 3.2, 3, 2.8, 2.4, 3.1, 3.1],
-            ["Ekitiké", "Forward", 8.5, 32, 26.2, 3.1, 2.6, 2.4, 3.3, 2.8, 3.1, 2.6, 2.9, 3.4],
-            ["N.Williams", "Defender", 5.0, 29, 26.2, 3.3, 2.6, 3.4, 2.1, 3.4, 3.7, 2, 2.9, 2.7],
-            ["Gündoğan", "Midfielder", 6.5, 33, 26.2, 3.2, 3.4, 2.9, 3, 2.2, 3.7, 2.6, 2.6, 2.5],
-            ["Joelinton", "Midfielder", 6.0, 25, 26, 2.6, 2.9, 3.4, 3.2, 2.7, 2.5, 3.1, 2.6, 3.1],
-            ["Ward-Prowse", "Midfielder", 6.0, 23, 26, 3.1, 2.9, 2.7, 3.1, 3, 2.8, 2.3, 3.1, 3.1],
-            ["Smith Rowe", "Midfielder", 6.0, 34, 26, 2.7, 3.1, 2.4, 3.8, 3.3, 2.5, 2.8, 2.7, 2.6],
-            ["Senesi", "Defender", 4.5, 31, 26, 2.3, 3.3, 2.5, 3.2, 2.6, 3.2, 3.1, 2.7, 3]
-        ]
-        
-        columns = ["Name", "Position", "Price", "Uncertainty", "Overall", "GW 1", "GW 2", "GW 3", "GW 4", "GW 5", "GW 6", "GW 7", "GW 8", "GW 9"]
-        df = pd.DataFrame(data, columns=columns)
-        return df
+        return pd.DataFrame(PLAYERS, columns=list(PLAYER_COLUMNS))
     
     def _fetch_teams_data(self) -> Dict:
-        """Fetch team data from FPL API"""
+        """Fetch team data from FPL API, cached on disk for TEAMS_CACHE_TTL"""
+        try:
+            if time.time() - TEAMS_CACHE_PATH.stat().st_mtime < TEAMS_CACHE_TTL:
+                # JSON object keys are strings; team ids are ints
+                return {int(k): v for k, v in json.loads(TEAMS_CACHE_PATH.read_text()).items()}
+        except (OSError, ValueError):
+            pass
+        
         try:
-            response = requests.get("https://fantasy.premierleague.com/api/bootstrap-static/")
+            response = self.session.get(BOOTSTRAP_URL, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 teams = {t["id"]: t["name"] for t in data["teams"]}
+                try:
+                    TEAMS_CACHE_PATH.write_text(json.dumps(teams))
+                except OSError as e:
+                    print(f"Error caching teams data: {e}")
                 return teams
             else:
                 print(f"Failed to fetch teams data: {response.status_code}")
@@ -134,135 +259,34 @@ class FPLTeamOptimizer:
     
     def get_optimal_team(self, budget: float = 100.0) -> Dict:
         """Get optimal FPL team within budget constraints following official FPL rules"""
-        # Official FPL squad composition rules
-        # Must have exactly: 2 GKs, 5 DEFs, 5 MIDs, 3 FWDs = 15 players total
-        formation_constraints = {
-            "Goalkeeper": (2, 2),      # Must have exactly 2 GKs
-            "Defender": (5, 5),         # Must have exactly 5 DEFs
-            "Midfielder": (5, 5),       # Must have exactly 5 MIDs
-            "Forward": (3, 3)           # Must have exactly 3 FWDs
-        }
-        
-        # Calculate total expected points for first 9 weeks
-        gw_columns = [f"GW {i}" for i in range(1, 10)]
-        self.players_data["Total_GW1_9"] = self.players_data[gw_columns].sum(axis=1)
-        
-        # Sort by total expected points (descending)
-        sorted_players = self.players_data.sort_values("Total_GW1_9", ascending=False)
+        names, positions, prices, gw_points = _player_arrays()
+        totals = gw_points.sum(axis=1)
+        self.players_data["Total_GW1_9"] = totals
         
-        selected_players = []
-        remaining_budget = budget
-        position_counts = {pos: 0 for pos in formation_constraints.keys()}
+        # Squad indices are memoized per budget; the player dicts are built
+        # fresh each call since callers fill in their Team
+        starting, bench = _solve(int(round(budget * 10)))
         
-        # First pass: select best players for each position to meet minimum requirements
-        for _, player in sorted_players.iterrows():
-            name = player["Name"]
-            position = player["Position"]
-            price = player["Price"]
-            total_points = player["Total_GW1_9"]
-            
-            # Check budget
-            if price > remaining_budget:
-                continue
-                
-            # Check position constraints
-            min_pos, max_pos = formation_constraints[position]
-            if position_counts[position] >= max_pos:
-                continue
-                
-            # Check if we already have this player
-            if name in [p["Name"] for p in selected_players]:
-                continue
-                
-            # Add player
-            selected_players.append({
-                "Name": name,
-                "Position": position,
-                "Price": price,
-                "Total_Points": total_points,
+        def squad_players(indices, status):
+            return [{
+                "Name": names[i],
+                "Position": positions[i],
+                "Price": float(prices[i]),
+                "Total_Points": float(totals[i]),
                 "Team": "Unknown",  # Will be filled later
-                "GW1_9_Breakdown": [player[f"GW {i}"] for i in range(1, 10)]
-            })
-            
-            remaining_budget -= price
-            position_counts[position] += 1
-            
-            # Stop if we have 15 players
-            if len(selected_players) >= 15:
-                break
-        
-        # Ensure we have exactly 15 players by filling remaining slots
-        while len(selected_players) < 15:
-            for _, player in sorted_players.iterrows():
-                name = player["Name"]
-                position = player["Position"]
-                price = player["Price"]
-                total_points = player["Total_GW1_9"]
-                
-                # Skip if already selected
-                if name in [p["Name"] for p in selected_players]:
-                    continue
-                    
-                # Check budget
-                if price > remaining_budget:
-                    continue
-                    
-                # Check position constraints
-                min_pos, max_pos = formation_constraints[position]
-                if position_counts[position] >= max_pos:
-                    continue
-                
-                # Add player
-                selected_players.append({
-                    "Name": name,
-                    "Position": position,
-                    "Price": price,
-                    "Total_Points": total_points,
-                    "Team": "Unknown",
-                    "GW1_9_Breakdown": [player[f"GW {i}"] for i in range(1, 10)]
-                })
-                
-                remaining_budget -= price
-                position_counts[position] += 1
-                break
-        
-        # Determine starting XI vs bench (4 players)
-        # Sort players by total points within each position
-        starting_players = []
-        bench_players = []
-        
-        for position in ["Goalkeeper", "Defender", "Midfielder", "Forward"]:
-            pos_players = [p for p in selected_players if p["Position"] == position]
-            pos_players.sort(key=lambda x: x["Total_Points"], reverse=True)
-            
-            if position == "Goalkeeper":
-                # 1st GK starts, 2nd GK on bench
-                starting_players.append(pos_players[0])
-                bench_players.append(pos_players[1])
-            elif position == "Defender":
-                # First 3-4 DEFs start (depending on formation), rest on bench
-                def_count = min(4, len(pos_players))
-                starting_players.extend(pos_players[:def_count])
-                bench_players.extend(pos_players[def_count:])
-            elif position == "Midfielder":
-                # First 4-5 MIDs start (depending on formation), rest on bench
-                mid_count = min(5, len(pos_players))
-                starting_players.extend(pos_players[:mid_count])
-                bench_players.extend(pos_players[mid_count:])
-            elif position == "Forward":
-                # First 1-2 FWDs start (depending on formation), rest on bench
-                fwd_count = min(2, len(pos_players))
-                starting_players.extend(pos_players[:fwd_count])
-                bench_players.extend(pos_players[fwd_count:])
+                "GW1_9_Breakdown": gw_points[i].tolist(),
+                "Status": status
+            } for i in indices]
         
-        # Add status to all players
-        for player in starting_players:
-            player["Status"] = "Starting"
-        for player in bench_players:
-            player["Status"] = "Bench"
+        starting_players = squad_players(starting, "Starting")
+        bench_players = squad_players(bench, "Bench")
         
         # Combine all players (starting first, then bench)
         all_players = starting_players + bench_players
+        remaining_budget = budget - float(prices[list(starting + bench)].sum())
+        position_counts = {pos: 0 for pos in FORMATION_CONSTRAINTS}
+        for player in all_players:
+            position_counts[player["Position"]] += 1
         
         # Calculate total expected points
         total_expected_points = sum(p["Total_Points"] for p in all_players)
@@ -0,0 +1,50 @@
+// Players table: DataTables server-side setup and the shared injury modal.
+// The table element carries the data URL and column list as data-* attributes.
+$(document).ready(function() {
+    const esc = $.fn.dataTable.render.text().display;
+    const badge = p => `<span class="position-badge ${p.PosClass}">${esc(p.Position)}</span>`;
+
+    // Cell renderers by column; the rest are shown as sent (decimals
+    // arrive already formatted)
+    const renderers = {
+        Name: v => `<strong>${esc(v)}</strong>`,
+        Position: (v, type, p) => badge(p),
+        Price: v => `£${v}M`,
+        Uncertainty: v => `${v}%`,
+        Total_GW1_9: v => `<strong>${v}</strong>`,
+        Chance_Playing: (v, type, p) => p.Is_Injured
+            ? `<span class="text-danger injury-link" style="cursor: pointer;"><i class="fas fa-exclamation-triangle"></i> ${v}%</span>`
+            : `<span class="text-success">100%</span>`
+    };
+
+    const table = $('#playersTable').DataTable({
+        serverSide: true,
+        processing: true,
+        ajax: $('#playersTable').data('source'),
+        columns: $('#playersTable').data('columns').map(c => ({data: c, render: renderers[c]})),
+        paging: true,
+        pageLength: 25,
+        ordering: true,
+        info: true,
+        searching: true,
+        order: [[6, 'desc']], // Sort by Total (GW1-9) by default
+        columnDefs: [
+            { targets: [0], orderable: false } // Rank column not sortable
+        ],
+        language: {
+            search: "Search players:",
+            lengthMenu: "Show _MENU_ players per page",
+            info: "Showing _START_ to _END_ of _TOTAL_ players"
+        }
+    });
+
+    const modal = $('#injuryModal');
+    $('#playersTable tbody').on('click', '.injury-link', function() {
+        const p = table.row($(this).closest('tr')).data();
+        modal.find('.injury-name').text(p.Name);
+        modal.find('.injury-chance').text(`${p.Chance_Playing}%`);
+        modal.find('.injury-position').replaceWith($(badge(p)).addClass('injury-position'));
+        modal.find('.injury-status').text(p.Injury_Status);
+        bootstrap.Modal.getOrCreateInstance(modal[0]).show();
+    });
+});
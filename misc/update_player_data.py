@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Add the extra players and fix up team names and references in one run
+"""
+
+from _db import connection
+from add_more_players import add_more_players
+from fix_team_names import fix_team_names
+from fix_team_references import fix_team_references
+
+def update_player_data():
+    """Run the player/team maintenance scripts in order on one connection"""
+    with connection() as conn:
+        add_more_players(conn)
+        fix_team_names(conn)
+        fix_team_references(conn)
+
+if __name__ == "__main__":
+    update_player_data()
@@ -35,6 +35,18 @@ def update_database_schema():
             # Create index for better performance
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_team_id ON players(team_id)")
         
+        # Relink team_id whenever a player's team is renamed (e.g. by
+        # fix_team_names.py), so renames need no separate team_id pass
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_players_team_id
+            AFTER UPDATE OF team ON players
+            BEGIN
+                UPDATE players
+                SET team_id = (SELECT t.id FROM teams t WHERE t.name = NEW.team)
+                WHERE id = NEW.id;
+            END
+        """)
+        
         # Fetch teams from FPL API
         print("Fetching teams from FPL API...")
         response = requests.get("https://fantasy.premierleague.com/api/bootstrap-static/")